@@ -0,0 +1,209 @@
+/**
+ * Tests for the email alerts cron route (/api/cron/email-alerts)
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { NextRequest } from 'next/server';
+
+const DAY_MS = 24 * 60 * 60 * 1000;
+
+// In-memory stand-in for the Supabase tables the cron route reads and writes
+const db = vi.hoisted(() => ({
+  alertSettings: [] as any[],
+  users: [] as any[],
+  usersInCalls: [] as string[][],
+  failUsersIn: null as null | ((ids: string[]) => boolean),
+  updates: [] as any[],
+}));
+
+const emailMocks = vi.hoisted(() => ({
+  sendDogMatchAlert: vi.fn(),
+  fetchAIReasoningForDogs: vi.fn(),
+}));
+
+vi.mock('resend', () => ({
+  Resend: vi.fn().mockImplementation(() => ({ emails: { send: vi.fn() } })),
+}));
+
+vi.mock('@/lib/config', () => ({
+  appConfig: { publicBaseUrl: 'http://test.local' },
+}));
+
+vi.mock('@/lib/tokens', () => ({
+  signUnsubToken: vi.fn(() => 'unsub-token'),
+}));
+
+vi.mock('@/lib/email/service', () => emailMocks);
+
+vi.mock('@/lib/supabase-auth', () => {
+  function makeQuery(table: string) {
+    let inIds: string[] = [];
+    const resolve = () => {
+      switch (table) {
+        case 'alert_settings':
+          return { data: db.alertSettings, error: null };
+        case 'users':
+          db.usersInCalls.push(inIds);
+          if (db.failUsersIn?.(inIds)) {
+            return { data: null, error: { message: 'URI too long' } };
+          }
+          return { data: db.users.filter((u) => inIds.includes(u.id)), error: null };
+        case 'preferences':
+          return { data: { zip_codes: ['10001'], radius: 50 }, error: null };
+        default:
+          return { data: null, error: null };
+      }
+    };
+    const query: any = {
+      select: () => query,
+      eq: () => query,
+      limit: () => query,
+      in: (_column: string, ids: string[]) => {
+        inIds = ids;
+        return query;
+      },
+      update: (values: any) => {
+        db.updates.push(values);
+        return query;
+      },
+      single: () => Promise.resolve(resolve()),
+      then: (onFulfilled: any, onRejected: any) => Promise.resolve(resolve()).then(onFulfilled, onRejected),
+    };
+    return query;
+  }
+  return {
+    getSupabaseClient: vi.fn(() => ({ from: (table: string) => makeQuery(table) })),
+  };
+});
+
+import { GET } from '@/app/api/cron/email-alerts/route';
+
+function cronRequest() {
+  return new NextRequest('http://localhost:3000/api/cron/email-alerts', {
+    headers: { authorization: 'Bearer test-cron-secret' },
+  });
+}
+
+function stubDogSearch(dogs: any[]) {
+  const fetchMock = vi.fn(async () =>
+    new Response(JSON.stringify({ items: dogs, total: dogs.length }), { status: 200 })
+  );
+  vi.stubGlobal('fetch', fetchMock);
+  return fetchMock;
+}
+
+function dog(id: string, publishedAt: string) {
+  return { id, name: `Dog ${id}`, breeds: ['Beagle'], photos: [], publishedAt };
+}
+
+describe('email alerts cron', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    process.env.CRON_SECRET = 'test-cron-secret';
+    db.alertSettings = [];
+    db.users = [];
+    db.usersInCalls = [];
+    db.failUsersIn = null;
+    db.updates = [];
+    emailMocks.sendDogMatchAlert.mockResolvedValue({ success: true, messageId: 'msg-1' });
+    emailMocks.fetchAIReasoningForDogs.mockResolvedValue({});
+  });
+
+  afterEach(() => {
+    vi.unstubAllGlobals();
+  });
+
+  describe('new or updated dog selection', () => {
+    const lastSentAt = new Date(Date.now() - 2 * DAY_MS).toISOString();
+
+    beforeEach(() => {
+      db.alertSettings = [
+        {
+          user_id: 'user-1',
+          enabled: true,
+          cadence: 'daily',
+          last_sent_at_utc: lastSentAt,
+          last_seen_ids: ['seen-before-cutoff', 'seen-after-cutoff'],
+        },
+      ];
+      db.users = [{ id: 'user-1', email: 'one@example.com', name: 'One' }];
+    });
+
+    it('re-sends a previously seen dog published after the last send', async () => {
+      stubDogSearch([
+        dog('seen-before-cutoff', new Date(Date.now() - 3 * DAY_MS).toISOString()),
+        dog('seen-after-cutoff', new Date(Date.now() - 1 * DAY_MS).toISOString()),
+      ]);
+
+      const body = await (await GET(cronRequest())).json();
+
+      expect(body.sent).toBe(1);
+      expect(emailMocks.sendDogMatchAlert).toHaveBeenCalledTimes(1);
+      const templateData = emailMocks.sendDogMatchAlert.mock.calls[0][0];
+      expect(templateData.matches.map((m: any) => m.id)).toEqual(['seen-after-cutoff']);
+      expect(templateData.totalMatches).toBe(1);
+    });
+
+    it('skips a previously seen dog published before the last send', async () => {
+      stubDogSearch([
+        dog('seen-before-cutoff', new Date(Date.now() - 3 * DAY_MS).toISOString()),
+      ]);
+
+      const body = await (await GET(cronRequest())).json();
+
+      expect(body.sent).toBe(0);
+      expect(emailMocks.sendDogMatchAlert).not.toHaveBeenCalled();
+      expect(body.results).toEqual([
+        expect.objectContaining({ user: 'one@example.com', status: 'no_new_matches' }),
+      ]);
+    });
+
+    it('does not treat a previously seen dog with no publish date as updated', async () => {
+      stubDogSearch([{ id: 'seen-after-cutoff', name: 'Undated', breeds: ['Beagle'], photos: [] }]);
+
+      const body = await (await GET(cronRequest())).json();
+
+      expect(body.sent).toBe(0);
+      expect(emailMocks.sendDogMatchAlert).not.toHaveBeenCalled();
+      expect(body.results).toEqual([
+        expect.objectContaining({ user: 'one@example.com', status: 'no_new_matches' }),
+      ]);
+    });
+  });
+
+  describe('user lookup', () => {
+    beforeEach(() => {
+      db.alertSettings = Array.from({ length: 150 }, (_, i) => ({
+        user_id: `user-${i}`,
+        enabled: true,
+        cadence: 'daily',
+      }));
+      db.users = db.alertSettings.map((as) => ({
+        id: as.user_id,
+        email: `${as.user_id}@example.com`,
+        name: as.user_id,
+      }));
+      // No dogs, so every processed user ends as no_matches without sending
+      stubDogSearch([]);
+    });
+
+    it('looks users up in bounded chunks', async () => {
+      const body = await (await GET(cronRequest())).json();
+
+      expect(db.usersInCalls.map((ids) => ids.length)).toEqual([100, 50]);
+      expect(body.processed).toBe(150);
+    });
+
+    it('skips only the users in a failed chunk', async () => {
+      db.failUsersIn = (ids) => ids.includes('user-0');
+
+      const response = await GET(cronRequest());
+      const body = await response.json();
+
+      expect(response.status).toBe(200);
+      expect(body.processed).toBe(50);
+      expect(body.results.map((r: any) => r.user)).not.toContain('user-0@example.com');
+      expect(body.results.map((r: any) => r.user)).toContain('user-149@example.com');
+    });
+  });
+});
@@ -0,0 +1,85 @@
+/**
+ * Tests for the dog detail route (/api/dogs/[id]) not-found caching
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { NextRequest } from 'next/server';
+
+const getDogByIdMock = vi.hoisted(() => vi.fn());
+
+vi.mock('@/lib/dogProviders', () => ({
+  getActiveDogProvider: () => ({ id: 'rescuegroups', getDogById: getDogByIdMock }),
+}));
+
+import { GET } from '@/app/api/dogs/[id]/route';
+
+const NOT_FOUND_TTL_MS = 5 * 60 * 1000;
+
+function getDog(id: string) {
+  return GET(new NextRequest(`http://localhost:3000/api/dogs/${id}`), {
+    params: Promise.resolve({ id }),
+  });
+}
+
+describe('GET /api/dogs/[id] not-found cache', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('answers a repeat request for a missing dog without calling the provider', async () => {
+    getDogByIdMock.mockResolvedValue(null);
+
+    const first = await getDog('missing-1');
+    expect(first.status).toBe(404);
+    const providerCalls = getDogByIdMock.mock.calls.length;
+
+    const second = await getDog('missing-1');
+    expect(second.status).toBe(404);
+    expect(second.headers.get('X-Cache')).toBe('HIT');
+    expect(getDogByIdMock).toHaveBeenCalledTimes(providerCalls);
+  });
+
+  it('does not cache a provider error', async () => {
+    getDogByIdMock.mockRejectedValueOnce(Object.assign(new Error('RescueGroups API error: 503'), { status: 503 }));
+
+    const failed = await getDog('flaky-1');
+    expect(failed.status).toBe(500);
+
+    getDogByIdMock.mockResolvedValueOnce({ id: 'flaky-1', name: 'Rex' });
+    const retried = await getDog('flaky-1');
+    expect(retried.status).toBe(200);
+    expect(retried.headers.get('X-Cache')).toBeNull();
+  });
+
+  it('does not cache a timeout', async () => {
+    getDogByIdMock.mockImplementation(() => new Promise(() => {}));
+
+    const pending = getDog('slow-1');
+    await vi.advanceTimersByTimeAsync(60_000);
+    expect((await pending).status).toBe(500);
+
+    getDogByIdMock.mockReset();
+    getDogByIdMock.mockResolvedValue({ id: 'slow-1', name: 'Rex' });
+    const retried = await getDog('slow-1');
+    expect(retried.status).toBe(200);
+  });
+
+  it('expires a not-found entry after its TTL', async () => {
+    getDogByIdMock.mockResolvedValue(null);
+
+    await getDog('missing-2');
+    const providerCalls = getDogByIdMock.mock.calls.length;
+
+    vi.advanceTimersByTime(NOT_FOUND_TTL_MS);
+    const afterExpiry = await getDog('missing-2');
+
+    expect(afterExpiry.status).toBe(404);
+    expect(afterExpiry.headers.get('X-Cache')).toBeNull();
+    expect(getDogByIdMock.mock.calls.length).toBeGreaterThan(providerCalls);
+  });
+});
@@ -0,0 +1,155 @@
+/**
+ * Tests for the RescueGroups dog provider (lib/dogProviders.ts)
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { RescueGroupsDogProvider } from '@/lib/dogProviders';
+
+function jsonResponse(body: unknown, status = 200) {
+  return new Response(JSON.stringify(body), {
+    status,
+    headers: { 'Content-Type': 'application/json' },
+  });
+}
+
+function unavailable() {
+  return new Response('upstream unavailable', { status: 503, statusText: 'Service Unavailable' });
+}
+
+const animalPage = {
+  data: [{ id: '42', type: 'animals', attributes: { name: 'Rex', adoptionUrl: 'https://example.com/rex' } }],
+  included: [],
+};
+
+describe('RescueGroupsDogProvider', () => {
+  let fetchMock: ReturnType<typeof vi.fn>;
+
+  beforeEach(() => {
+    process.env.RESCUEGROUPS_API_KEY = 'test-key';
+    fetchMock = vi.fn();
+    vi.stubGlobal('fetch', fetchMock);
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+    vi.unstubAllGlobals();
+  });
+
+  describe('5xx retries', () => {
+    it('retries 503s and returns the first successful response', async () => {
+      fetchMock
+        .mockResolvedValueOnce(unavailable())
+        .mockResolvedValueOnce(unavailable())
+        .mockResolvedValueOnce(jsonResponse(animalPage));
+
+      const pending = new RescueGroupsDogProvider().getDogById('42');
+      await vi.runAllTimersAsync();
+      const dog = await pending;
+
+      expect(fetchMock).toHaveBeenCalledTimes(3);
+      expect(dog?.name).toBe('Rex');
+    });
+
+    it('gives up after three 503s with the upstream status', async () => {
+      fetchMock.mockImplementation(async () => unavailable());
+
+      const pending = new RescueGroupsDogProvider().getDogById('42').catch((err) => err);
+      await vi.runAllTimersAsync();
+      const err = await pending;
+
+      expect(fetchMock).toHaveBeenCalledTimes(3);
+      expect(err).toBeInstanceOf(Error);
+      expect(err.status).toBe(503);
+    });
+
+    it('stops retrying once the caller aborts', async () => {
+      fetchMock.mockImplementation(async () => unavailable());
+      const controller = new AbortController();
+
+      const pending = new RescueGroupsDogProvider()
+        .getDogById('42', { signal: controller.signal })
+        .catch((err) => err);
+      await vi.advanceTimersByTimeAsync(0);
+      controller.abort();
+      await vi.runAllTimersAsync();
+
+      expect(await pending).toBeInstanceOf(Error);
+      expect(fetchMock).toHaveBeenCalledTimes(1);
+    });
+  });
+});
+
+describe('RescueGroupsDogProvider multi-value search merge', () => {
+  const publishedDog = (id: string, minutesAgo: number) =>
+    ({ id, name: id, publishedAt: new Date(Date.UTC(2025, 0, 1) - minutesAgo * 60_000).toISOString() }) as any;
+
+  // Per-age sub-call results, each sorted by publishedAt desc like the API returns them
+  const byAge: Record<string, any[]> = {
+    baby: [publishedDog('d1', 1), publishedDog('d3', 3), publishedDog('d5', 5)],
+    young: [publishedDog('d2', 2), publishedDog('d3', 3), publishedDog('d4', 4)],
+  };
+
+  let singleCall: ReturnType<typeof vi.spyOn>;
+
+  beforeEach(() => {
+    process.env.RESCUEGROUPS_API_KEY = 'test-key';
+    singleCall = vi
+      .spyOn(RescueGroupsDogProvider.prototype as any, 'makeSingleSearchCall')
+      .mockImplementation(async (params: any) => {
+        const items = byAge[params.age[0]];
+        return { items, page: 1, pageSize: items.length, total: items.length };
+      });
+  });
+
+  afterEach(() => {
+    singleCall.mockRestore();
+  });
+
+  it('merges overlapping calls newest-first and pages through the merged list', async () => {
+    const provider = new RescueGroupsDogProvider();
+    const search = (page: number) =>
+      provider.searchDogs({ zip: '11111', age: ['baby', 'young'], page, limit: 2 });
+
+    const page1 = await search(1);
+    const page2 = await search(2);
+    const page3 = await search(3);
+
+    expect(page1.items.map((d) => d.id)).toEqual(['d1', 'd2']);
+    expect(page2.items.map((d) => d.id)).toEqual(['d3', 'd4']);
+    expect(page3.items.map((d) => d.id)).toEqual(['d5']);
+    // d3 comes back from both calls but is counted once
+    expect(page1.total).toBe(5);
+    expect(page3.total).toBe(5);
+    expect(page1.partial).toBeUndefined();
+    // Later pages re-slice the cached sub-call results
+    expect(singleCall).toHaveBeenCalledTimes(2);
+  });
+
+  it('serves the surviving calls when one fails, without caching the partial set', async () => {
+    singleCall.mockImplementation(async (params: any) => {
+      if (params.age[0] === 'baby') throw new Error('RescueGroups API error: 500');
+      const items = byAge[params.age[0]];
+      return { items, page: 1, pageSize: items.length, total: items.length };
+    });
+    const provider = new RescueGroupsDogProvider();
+    const search = () => provider.searchDogs({ zip: '22222', age: ['baby', 'young'], page: 1, limit: 10 });
+
+    const first = await search();
+    expect(first.items.map((d) => d.id)).toEqual(['d2', 'd3', 'd4']);
+    expect(first.total).toBe(3);
+    expect(first.partial).toBe(true);
+
+    await search();
+    expect(singleCall).toHaveBeenCalledTimes(4);
+  });
+
+  it('throws instead of returning an empty page when every call fails', async () => {
+    singleCall.mockRejectedValue(new Error('RescueGroups API error: 503'));
+    const provider = new RescueGroupsDogProvider();
+
+    await expect(
+      provider.searchDogs({ zip: '33333', age: ['baby', 'young'], page: 1, limit: 10 })
+    ).rejects.toThrow('RescueGroups API error: 503');
+  });
+});
@@ -0,0 +1,116 @@
+/**
+ * Tests for the dog search route (/api/dogs) query validation
+ */
+
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { NextRequest } from 'next/server';
+
+const searchDogsMock = vi.hoisted(() => vi.fn());
+
+vi.mock('@/lib/dogProviders', () => ({
+  getActiveDogProvider: () => ({ id: 'rescuegroups', searchDogs: searchDogsMock }),
+}));
+
+vi.mock('@/lib/inference/trait-inference', () => ({
+  inferDogTraitsBatch: vi.fn(),
+}));
+
+vi.mock('@/lib/inference/trait-storage', () => ({
+  storeInferredTraits: vi.fn(),
+  getInferredTraitsBatch: vi.fn(),
+}));
+
+import { GET } from '@/app/api/dogs/route';
+
+function dogsRequest(query: string) {
+  return new NextRequest(`http://localhost:3000/api/dogs?${query}`);
+}
+
+describe('GET /api/dogs query validation', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    // No items, so the background trait inference is never scheduled
+    searchDogsMock.mockResolvedValue({ items: [], page: 1, pageSize: 0, total: 0 });
+  });
+
+  it('rejects an unknown sort', async () => {
+    const response = await GET(dogsRequest('zip=10001&sort=foo'));
+
+    expect(response.status).toBe(400);
+    expect(await response.json()).toEqual({
+      error: 'Invalid query parameters',
+      details: 'sort=foo',
+    });
+    expect(searchDogsMock).not.toHaveBeenCalled();
+  });
+
+  it('accepts mixed-case ages and forwards them canonicalized', async () => {
+    const response = await GET(dogsRequest('zip=10002&age=young,Baby,YOUNG'));
+
+    expect(response.status).toBe(200);
+    expect(searchDogsMock).toHaveBeenCalledTimes(1);
+    expect(searchDogsMock.mock.calls[0][0].age).toEqual(['baby', 'young']);
+  });
+
+  it('accepts sort case-insensitively', async () => {
+    const response = await GET(dogsRequest('zip=10004&sort=Distance'));
+
+    expect(response.status).toBe(200);
+    expect(searchDogsMock.mock.calls[0][0].sort).toBe('distance');
+  });
+
+  it('rejects an unknown size and names it in details', async () => {
+    const response = await GET(dogsRequest('zip=10003&size=small,xxl'));
+
+    expect(response.status).toBe(400);
+    expect(await response.json()).toEqual({
+      error: 'Invalid query parameters',
+      details: 'size=xxl',
+    });
+    expect(searchDogsMock).not.toHaveBeenCalled();
+  });
+});
+
+describe('GET /api/dogs partial results', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  it('serves a partial page without caching it', async () => {
+    searchDogsMock.mockResolvedValue({ items: [], page: 1, pageSize: 0, total: 0, partial: true });
+
+    const first = await GET(dogsRequest('zip=20001&age=baby,young'));
+    expect(first.status).toBe(200);
+    expect(first.headers.get('Cache-Control')).toBe('no-store');
+
+    const second = await GET(dogsRequest('zip=20001&age=baby,young'));
+    expect(second.headers.get('X-Cache')).toBe('MISS');
+    expect(searchDogsMock).toHaveBeenCalledTimes(2);
+  });
+
+  it('caches a complete page', async () => {
+    searchDogsMock.mockResolvedValue({ items: [], page: 1, pageSize: 0, total: 0 });
+
+    const first = await GET(dogsRequest('zip=20002&age=baby,young'));
+    expect(first.headers.get('Cache-Control')).toContain('s-maxage=60');
+
+    const second = await GET(dogsRequest('zip=20002&age=baby,young'));
+    expect(second.headers.get('X-Cache')).toBe('HIT');
+    expect(searchDogsMock).toHaveBeenCalledTimes(1);
+  });
+});
+
+describe('GET /api/dogs cache keys', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+    searchDogsMock.mockResolvedValue({ items: [], page: 1, pageSize: 0, total: 0 });
+  });
+
+  it('keeps free-text fields containing "|" from colliding', async () => {
+    await GET(dogsRequest('zip=30001|50&breed=b'));
+    const second = await GET(dogsRequest('zip=30001&radius=50&breed=|b'));
+
+    expect(second.headers.get('X-Cache')).toBe('MISS');
+    expect(searchDogsMock).toHaveBeenCalledTimes(2);
+  });
+});
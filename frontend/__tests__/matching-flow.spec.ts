@@ -111,6 +111,16 @@ describe('Guidance Parsing', () => {
     expect(tokens.flags.firstTimeOwner).toBe(true);
     expect(tokens.flags.lowMaintenance).toBe(true);
   });
+
+  it('should return frozen tokens when there is no guidance', () => {
+    const tokens = tokenizeGuidance('   ');
+
+    expect(tokens.flags.kidFriendly).toBe(false);
+    expect(() => {
+      tokens.flags.kidFriendly = true;
+    }).toThrow(TypeError);
+    expect(tokenizeGuidance(undefined).flags.kidFriendly).toBe(false);
+  });
 });
 
 describe('Normalization', () => {
@@ -216,6 +226,24 @@ describe('Filtering', () => {
     expect(filtered.map(d => d.id)).toEqual(['1', '3']);
   });
 
+  it('should skip breed filtering when no breeds are specified', () => {
+    const effectivePrefs = normalizeUserPreferences({
+      zipCodes: ['10001'],
+      radiusMi: 100,
+      breedsInclude: [],
+      breedsExclude: [],
+      age: [],
+      size: [],
+      energy: undefined,
+      temperament: [],
+      guidance: ''
+    });
+
+    const filtered = filterByBreeds(sampleDogs, effectivePrefs);
+    
+    expect(filtered).toBe(sampleDogs);
+  });
+
   it('should apply all filters correctly', () => {
     const effectivePrefs = normalizeUserPreferences({
       zipCodes: ['10001'],
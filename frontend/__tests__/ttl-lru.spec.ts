@@ -0,0 +1,50 @@
+/**
+ * Tests for the shared in-process TTL/LRU cache (lib/cache/ttl-lru.ts)
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { TtlLruCache, jitteredTtl } from '@/lib/cache/ttl-lru';
+
+describe('TtlLruCache', () => {
+  beforeEach(() => {
+    vi.useFakeTimers();
+  });
+
+  afterEach(() => {
+    vi.useRealTimers();
+  });
+
+  it('returns values until their TTL passes, then drops them', () => {
+    const cache = new TtlLruCache<string>(10);
+    cache.set('a', 'one', 1000);
+
+    vi.advanceTimersByTime(999);
+    expect(cache.get('a')).toBe('one');
+
+    vi.advanceTimersByTime(1);
+    expect(cache.get('a')).toBeUndefined();
+    expect(cache.size).toBe(0);
+  });
+
+  it('evicts the least recently used entry past the cap', () => {
+    const cache = new TtlLruCache<number>(2);
+    cache.set('a', 1, 1000);
+    cache.set('b', 2, 1000);
+    cache.get('a'); // a is now more recent than b
+    cache.set('c', 3, 1000);
+
+    expect(cache.get('b')).toBeUndefined();
+    expect(cache.get('a')).toBe(1);
+    expect(cache.get('c')).toBe(3);
+  });
+});
+
+describe('jitteredTtl', () => {
+  it('stays within ±15% of the base TTL', () => {
+    for (let i = 0; i < 100; i++) {
+      const ttl = jitteredTtl(1000);
+      expect(ttl).toBeGreaterThanOrEqual(850);
+      expect(ttl).toBeLessThanOrEqual(1150);
+    }
+  });
+});
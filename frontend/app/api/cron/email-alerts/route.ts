@@ -5,6 +5,12 @@ import { RATE_LIMITS } from '@/lib/email/config';
 import { appConfig } from '@/lib/config';
 import crypto from 'crypto';
 
+// Max users processed at once by the cron job
+const CRON_USER_CONCURRENCY = 4;
+
+// User IDs per users lookup; keeps each .in() request URL well under gateway limits
+const USER_LOOKUP_CHUNK_SIZE = 100;
+
 /**
  * Shared function to handle cron job execution
  * Used by both GET (Vercel automatic) and POST (manual triggers)
@@ -90,18 +96,40 @@ async function handleCronJob(request: NextRequest) {
       });
     }
 
-    // Now fetch users for each alert_setting
-    // Filter out any alert_settings where the user doesn't exist
+    // Now fetch users for the alert_settings in batched .in() queries.
+    // Chunked so the PostgREST URL stays bounded; a failed chunk only skips
+    // its own users (they fall through to "User not found" below).
+    const userIds = Array.from(new Set(alertSettingsRaw.map((as: any) => as.user_id)));
+    const userIdChunks: string[][] = [];
+    for (let i = 0; i < userIds.length; i += USER_LOOKUP_CHUNK_SIZE) {
+      userIdChunks.push(userIds.slice(i, i + USER_LOOKUP_CHUNK_SIZE));
+    }
+
+    const usersById = new Map<string, any>();
+    await Promise.all(
+      userIdChunks.map(async (chunk) => {
+        const { data: usersData, error: usersError } = await client
+          .from('users' as any)
+          .select('id, email, name')
+          .in('id', chunk);
+
+        if (usersError) {
+          console.warn(`⚠️ Error fetching ${chunk.length} users for alert settings, skipping them:`, usersError);
+          return;
+        }
+
+        for (const u of (usersData || []) as any[]) {
+          usersById.set(u.id, { email: u.email, name: u.name });
+        }
+      })
+    );
+
     const alertSettings: Array<any> = [];
-    for (const alertSetting of alertSettingsRaw) {
-      const { data: user, error: userError } = await client
-        .from('users' as any)
-        .select('email, name')
-        .eq('id', alertSetting.user_id)
-        .single();
-
-      if (userError || !user) {
-        console.warn(`⚠️ User not found for alert_setting user_id: ${alertSetting.user_id}`, userError?.message);
+    for (const alertSetting of alertSettingsRaw as any[]) {
+      const user = usersById.get(alertSetting.user_id);
+
+      if (!user) {
+        console.warn(`⚠️ User not found for alert_setting user_id: ${alertSetting.user_id}`);
         continue;
       }
 
@@ -150,8 +178,13 @@ async function handleCronJob(request: NextRequest) {
       messageId?: string;
     }> = [];
 
+    // Take "now" once per run so every user is judged against the same clock
+    const runStartedMs = Date.now();
+    const todayStartMs = new Date(runStartedMs).setHours(0, 0, 0, 0);
+    const defaultCutoffMs = runStartedMs - 7 * 24 * 60 * 60 * 1000;
+
     // Process each user with individual error handling
-    for (const alertSetting of alertSettings) {
+    const processAlertSetting = async (alertSetting: any): Promise<void> => {
       const userEmail = (alertSetting as any).users?.email;
       if (!userEmail) {
         console.error('❌ Alert setting missing user email:', alertSetting);
@@ -161,7 +194,7 @@ async function handleCronJob(request: NextRequest) {
           status: 'error',
           error: 'Missing user email in alert setting',
         });
-        continue;
+        return;
       }
 
       try {
@@ -182,7 +215,7 @@ async function handleCronJob(request: NextRequest) {
             status: 'no_prefs',
             reason: prefsError?.message || 'No preferences found for user',
           });
-          continue;
+          return;
         }
 
         const preferences = prefs as any;
@@ -190,33 +223,29 @@ async function handleCronJob(request: NextRequest) {
         console.log(`👤 Processing user: ${user.email}`);
 
         // Check if we already sent an email today (simplified rate limiting)
-        const today = new Date();
         const lastSent = (alertSetting as any).last_sent_at_utc ? new Date((alertSetting as any).last_sent_at_utc) : null;
         
         if (lastSent) {
-          const todayStart = new Date(today);
-          todayStart.setHours(0, 0, 0, 0);
-          
-          if (lastSent >= todayStart) {
+          if (lastSent.getTime() >= todayStartMs) {
             console.log(`⏰ Email already sent today for ${user.email}`);
             results.push({
               user: user.email,
               status: 'already_sent_today',
               reason: 'Email already sent today',
             });
-            continue;
+            return;
           }
         }
 
         // Check if user is paused
-        if ((alertSetting as any).paused_until && new Date((alertSetting as any).paused_until) > new Date()) {
+        if ((alertSetting as any).paused_until && Date.parse((alertSetting as any).paused_until) > runStartedMs) {
           console.log(`⏸️ User ${user.email} is paused until ${(alertSetting as any).paused_until}`);
           results.push({
             user: user.email,
             status: 'paused',
             reason: 'User has paused alerts',
           });
-          continue;
+          return;
         }
 
         // Convert preferences to search parameters
@@ -280,7 +309,7 @@ async function handleCronJob(request: NextRequest) {
             status: 'error',
             error: `Dog search failed: ${searchError instanceof Error ? searchError.message : 'Unknown error'}`,
           });
-          continue;
+          return;
         }
         
         if (!dogsResponse.dogs || dogsResponse.dogs.length === 0) {
@@ -290,7 +319,7 @@ async function handleCronJob(request: NextRequest) {
             status: 'no_matches',
             reason: 'No dogs found matching preferences',
           });
-          continue;
+          return;
         }
 
         // Calculate matches_found_total: dogs that are new or updated since last_sent_at
@@ -298,26 +327,33 @@ async function handleCronJob(request: NextRequest) {
           ? new Date((alertSetting as any).last_sent_at_utc) 
           : null;
         
-        // If no last_sent_at, use last 7 days as cutoff
-        const cutoffDate = lastSentAt || new Date(Date.now() - 7 * 24 * 60 * 60 * 1000);
+        // If no last_sent_at, use last 7 days as cutoff. Kept as epoch ms so the
+        // loop below compares numbers instead of Date objects.
+        const cutoffMs = lastSentAt ? lastSentAt.getTime() : defaultCutoffMs;
         
         const lastSeenIds = (alertSetting as any).last_seen_ids || [];
+        const lastSeen = new Set<string>(lastSeenIds);
         
-        // Filter dogs that are new or updated since last send
-        // New: not in last_seen_ids
-        // Updated: published_at > cutoffDate (if available)
-        const newOrUpdatedDogs = dogsResponse.dogs.filter((dog: any) => {
-          const isNew = !lastSeenIds.includes(dog.id);
-          const isUpdated = dog.published_at && new Date(dog.published_at) > cutoffDate;
-          return isNew || isUpdated;
-        });
-        
-        // De-dupe by source ID (dog.id)
-        const uniqueDogs = Array.from(
-          new Map(newOrUpdatedDogs.map((dog: any) => [dog.id, dog])).values()
-        );
+        // Limit number of dogs per email
+        const maxDogs = 5; // Could be configurable per user
         
-        const matchesFoundTotal = uniqueDogs.length;
+        // Single pass over the search results: keep only dogs that are new or
+        // updated since last send, de-dupe by source ID (dog.id), count them all
+        // for matches_found_total, but hold on to just the first maxDogs.
+        // New: not in last_seen_ids
+        // Updated: publishedAt > cutoff (if available)
+        const countedIds = new Set<string>();
+        const dogsToSend: any[] = [];
+        let matchesFoundTotal = 0;
+        for (const dog of dogsResponse.dogs) {
+          if (countedIds.has(dog.id)) continue;
+          const isNew = !lastSeen.has(dog.id);
+          const isUpdated = !!dog.publishedAt && Date.parse(dog.publishedAt) > cutoffMs;
+          if (!isNew && !isUpdated) continue;
+          countedIds.add(dog.id);
+          matchesFoundTotal++;
+          if (dogsToSend.length < maxDogs) dogsToSend.push(dog);
+        }
 
         // Skip send if no matches found
         if (matchesFoundTotal === 0) {
@@ -327,15 +363,8 @@ async function handleCronJob(request: NextRequest) {
             status: 'no_new_matches',
             reason: 'No new or updated dogs since last alert',
           });
-          continue;
+          return;
         }
-        
-        // Use the unique dogs for email
-        const newDogs = uniqueDogs;
-
-        // Limit number of dogs per email
-        const maxDogs = 5; // Could be configurable per user
-        const dogsToSend = newDogs.slice(0, maxDogs);
 
         // Fetch AI reasoning for dogs (with timeout/error handling)
         console.log(`🤖 Fetching AI reasoning for ${dogsToSend.length} dogs for ${userEmail}...`);
@@ -477,7 +506,20 @@ async function handleCronJob(request: NextRequest) {
           error: error instanceof Error ? error.message : 'Unknown error',
         });
       }
-    }
+    };
+
+    // Each user is independent and bound on network I/O (dog search, AI
+    // reasoning, email send), so run a small pool of workers instead of one
+    // user at a time. Kept low to stay friendly to the provider and Resend.
+    let nextIndex = 0;
+    const worker = async () => {
+      while (nextIndex < alertSettings.length) {
+        await processAlertSetting(alertSettings[nextIndex++]);
+      }
+    };
+    await Promise.all(
+      Array.from({ length: Math.min(CRON_USER_CONCURRENCY, alertSettings.length) }, worker)
+    );
 
     console.log(`✅ Email alerts cron job completed: ${processed} processed, ${sent} sent, ${errors} errors`);
 
@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getServerSession } from 'next-auth';
-import { getResendClient, EMAIL_CONFIG } from '@/lib/email/config';
+import { getResendClient, acquireSendSlot, EMAIL_CONFIG } from '@/lib/email/config';
 import { appConfig } from '@/lib/config';
 import { requireNonProduction } from '@/lib/api/helpers';
 
@@ -53,6 +53,7 @@ export async function POST(request: NextRequest) {
     });
 
     // Send a simple test email
+    await acquireSendSlot();
     const result = await resend.emails.send({
       from: EMAIL_CONFIG.from,
       to: [testEmail],
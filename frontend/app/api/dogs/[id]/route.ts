@@ -1,5 +1,12 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { getActiveDogProvider } from '@/lib/dogProviders';
+import { TtlLruCache } from '@/lib/cache/ttl-lru';
+
+// Remember IDs the provider reported as missing (adopted/removed dogs, stale
+// links) so repeat requests don't re-run the full retry sequence upstream.
+const NOT_FOUND_TTL_MS = 5 * 60 * 1000;
+const NOT_FOUND_MAX_ENTRIES = 1000;
+const notFoundIds = new TtlLruCache<true>(NOT_FOUND_MAX_ENTRIES);
 
 export async function GET(
   request: NextRequest,
@@ -20,6 +27,18 @@ export async function GET(
       );
     }
 
+    if (notFoundIds.get(id)) {
+      const headers = new Headers();
+      headers.set('X-Request-ID', requestId);
+      headers.set('X-Backend-Duration', '0');
+      headers.set('X-Route', '/api/dogs/[id]');
+      headers.set('X-Cache', 'HIT');
+      return NextResponse.json(
+        { error: 'Dog not found' },
+        { status: 404, headers }
+      );
+    }
+
     console.log(`[${requestId}] 🔄 Fetching dog from provider`, { id });
 
     // Fetch with retry and timeouts
@@ -32,9 +51,10 @@ export async function GET(
       const controller = new AbortController();
       const timeoutId = setTimeout(() => controller.abort(), timeoutMs);
       try {
-        const dogPromise = provider.getDogById(id);
+        // The abort both ends the race and stops the provider's own retries
+        const dogPromise = provider.getDogById(id, { signal: controller.signal });
         const timeoutPromise = new Promise<null>((_, reject) =>
-          setTimeout(() => reject(new Error('TimeoutError')), timeoutMs)
+          controller.signal.addEventListener('abort', () => reject(new Error('TimeoutError')), { once: true })
         );
 
         const dog = await Promise.race([dogPromise, timeoutPromise]);
@@ -43,6 +63,7 @@ export async function GET(
 
         if (!dog) {
           if (attempt === maxRetries) {
+            notFoundIds.set(id, true, NOT_FOUND_TTL_MS);
             const headers = new Headers();
             headers.set('X-Request-ID', requestId);
             headers.set('X-Backend-Duration', `${backendDuration}`);
@@ -70,7 +91,8 @@ export async function GET(
         backendDuration = Date.now() - backendStart;
         clearTimeout(timeoutId);
         console.warn(`[${requestId}] ⚠️ Dog fetch attempt ${attempt}/${maxRetries} failed after ${backendDuration}ms:`, (err as Error)?.message);
-        if (attempt === maxRetries) throw err;
+        // Upstream status errors were already retried by the provider
+        if (attempt === maxRetries || (err as { status?: number })?.status) throw err;
         await new Promise((r) => setTimeout(r, attempt * 2000));
       }
     }
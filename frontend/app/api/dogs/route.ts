@@ -1,9 +1,64 @@
-import { NextRequest, NextResponse } from 'next/server';
+import { NextRequest, NextResponse, after } from 'next/server';
 import { inferDogTraitsBatch } from '@/lib/inference/trait-inference';
-import { storeInferredTraits, getInferredTraits } from '@/lib/inference/trait-storage';
+import { storeInferredTraits, getInferredTraitsBatch } from '@/lib/inference/trait-storage';
 import { Dog as SchemaDog } from '@/lib/schemas';
 import { getActiveDogProvider, type SearchDogsParams } from '@/lib/dogProviders';
 import type { Dog as ProviderDog } from '@/lib/api';
+import { TtlLruCache, jitteredTtl } from '@/lib/cache/ttl-lru';
+
+// Let the Vercel edge serve repeat queries for the same window as the
+// in-memory cache below, so identical searches don't reach the function.
+const DOGS_CACHE_CONTROL = 'public, s-maxage=60, stale-while-revalidate=120';
+
+const DOGS_CACHE_TTL_MS = 60_000;
+// Zip/radius/breed combinations are effectively unbounded
+const DOGS_CACHE_MAX_ENTRIES = 500;
+
+// Accepted query values; anything else is rejected before reaching the provider
+const VALID_SORTS: ReadonlySet<string> = new Set(['freshness', 'distance', 'age', 'size']);
+const VALID_AGES: ReadonlySet<string> = new Set(['baby', 'young', 'adult', 'senior']);
+const VALID_SIZES: ReadonlySet<string> = new Set(['small', 'medium', 'large', 'xl']);
+
+/**
+ * Return the canonical tokens that aren't in `allowed`
+ */
+function invalidTokens(tokens: string[] | undefined, allowed: ReadonlySet<string>): string[] {
+  return tokens ? tokens.filter((token) => !allowed.has(token)) : [];
+}
+
+/**
+ * Canonical form of a CSV filter: trimmed, lowercased, deduped and sorted, so
+ * "Young,baby" and "baby,young" reach the provider (and the cache) as one query.
+ */
+function canonicalList(value: string | null): string[] | undefined {
+  if (!value) return undefined;
+  const tokens = new Set<string>();
+  for (const raw of value.split(',')) {
+    const token = raw.trim().toLowerCase();
+    if (token) tokens.add(token);
+  }
+  return tokens.size > 0 ? Array.from(tokens).sort() : undefined;
+}
+
+/**
+ * Cache key for a normalized query: JSON of the fields in a fixed order.
+ * zip and breed are free text, so a plain delimiter join could collide
+ * (`zip=1|2` vs `zip=1&radius=2`); JSON quoting keeps fields apart while
+ * still not serializing property names.
+ */
+function dogsCacheKey(params: SearchDogsParams): string {
+  return `dogs:${JSON.stringify([
+    params.zip ?? '',
+    params.radius ?? '',
+    params.age ?? '',
+    params.size ?? '',
+    params.includeBreeds ?? '',
+    params.excludeBreeds ?? '',
+    params.sort ?? '',
+    params.page ?? '',
+    params.limit ?? '',
+  ])}`;
+}
 
 export async function GET(request: NextRequest) {
   const startTime = Date.now();
@@ -12,38 +67,79 @@ export async function GET(request: NextRequest) {
   try {
     // Get the search params from the request
     const { searchParams } = new URL(request.url);
-    const zipParam = searchParams.get('zip') || '';
-    const coarseZip = zipParam.split(',')[0]?.slice(0, 3) || '';
     
-    // Log request details
-    const hasGuidance = searchParams.has('guidance');
-    const guidanceLength = searchParams.get('guidance')?.length || 0;
-    console.log(`[${requestId}] 🔄 /api/dogs called`, {
-      hasGuidance,
-      guidanceLength,
-      params: Object.fromEntries(searchParams.entries()),
-      zipCoarse: coarseZip,
-      timestamp: new Date().toISOString()
-    });
+    // Log request details (development only - this runs on every search)
+    if (process.env.NODE_ENV === 'development') {
+      const zipParam = searchParams.get('zip') || '';
+      const coarseZip = zipParam.split(',')[0]?.slice(0, 3) || '';
+      console.log(`[${requestId}] 🔄 /api/dogs called`, {
+        hasGuidance: searchParams.has('guidance'),
+        guidanceLength: searchParams.get('guidance')?.length || 0,
+        params: Object.fromEntries(searchParams.entries()),
+        zipCoarse: coarseZip,
+        timestamp: new Date().toISOString()
+      });
+    }
     
+    // Parse each CSV filter once into canonical tokens, then validate those.
+    // sort is matched case-insensitively like age and size.
+    const ages = canonicalList(searchParams.get('age'));
+    const sizes = canonicalList(searchParams.get('size'));
+    const sortParam = searchParams.get('sort')?.trim().toLowerCase() || undefined;
+
+    // Reject unknown enum values up front instead of forwarding them upstream
+    const invalid = [
+      ...(sortParam && !VALID_SORTS.has(sortParam) ? [`sort=${sortParam}`] : []),
+      ...invalidTokens(ages, VALID_AGES).map((t) => `age=${t}`),
+      ...invalidTokens(sizes, VALID_SIZES).map((t) => `size=${t}`),
+    ];
+    if (invalid.length > 0) {
+      const headers = new Headers();
+      headers.set('X-Request-ID', requestId);
+      headers.set('X-Route', '/api/dogs');
+      return NextResponse.json(
+        { error: 'Invalid query parameters', details: invalid.join(', ') },
+        { status: 400, headers }
+      );
+    }
+
     // Normalize query for provider
     const limit = Math.min(parseInt(searchParams.get('limit') || '20', 10) || 20, 20);
     const page = parseInt(searchParams.get('page') || '1', 10) || 1;
     const providerParams: SearchDogsParams = {
-      zip: searchParams.get('zip') || undefined,
+      zip: searchParams.get('zip')?.trim() || undefined,
       radius: searchParams.get('radius') ? parseInt(searchParams.get('radius') as string, 10) : undefined,
-      age: searchParams.get('age') || undefined,
-      size: searchParams.get('size') || undefined,
-      includeBreeds: searchParams.get('breed') || undefined,
-      sort: (searchParams.get('sort') as any) || 'freshness',
+      age: ages,
+      size: sizes,
+      includeBreeds: canonicalList(searchParams.get('breed')),
+      sort: (sortParam as SearchDogsParams['sort']) || 'freshness',
       page,
       limit,
     };
 
+    // Simple 60s in-memory cache per normalized query
+    // Entries hold the already-serialized JSON body so hits skip encoding.
+    (globalThis as any).__DOGS_CACHE__ = (globalThis as any).__DOGS_CACHE__ || new TtlLruCache<string>(DOGS_CACHE_MAX_ENTRIES);
+    const cache = (globalThis as any).__DOGS_CACHE__ as TtlLruCache<string>;
+    const cacheKey = dogsCacheKey(providerParams);
+    const cachedBody = cache.get(cacheKey);
+    if (cachedBody !== undefined) {
+      // Serve the stored body as-is: no copy, no re-serialization per hit.
+      const hitHeaders = new Headers();
+      hitHeaders.set('Content-Type', 'application/json');
+      hitHeaders.set('X-Request-ID', requestId);
+      hitHeaders.set('X-Backend-Duration', '0');
+      hitHeaders.set('X-Total-Duration', `${Date.now() - startTime}`);
+      hitHeaders.set('X-Route', '/api/dogs');
+      hitHeaders.set('Cache-Control', DOGS_CACHE_CONTROL);
+      hitHeaders.set('X-Cache', 'HIT');
+      return new NextResponse(cachedBody, { headers: hitHeaders });
+    }
+
     const provider = getActiveDogProvider();
 
     const attemptStart = Date.now();
-    const { items: dogs, page: currentPage, pageSize, total } = await provider.searchDogs(providerParams);
+    const { items: dogs, page: currentPage, pageSize, total, partial } = await provider.searchDogs(providerParams);
     const backendDuration = Date.now() - attemptStart;
 
     const totalDuration = Date.now() - startTime;
@@ -52,22 +148,24 @@ export async function GET(request: NextRequest) {
     responseHeaders.set('X-Backend-Duration', `${backendDuration}`);
     responseHeaders.set('X-Total-Duration', `${totalDuration}`);
     responseHeaders.set('X-Route', '/api/dogs');
+    // A partial result (some provider sub-calls failed) is served once but
+    // never cached here or at the edge, so the next request tries again.
+    responseHeaders.set('Cache-Control', partial ? 'no-store' : DOGS_CACHE_CONTROL);
 
-    // Simple 60s in-memory cache per normalized query
     try {
-      (globalThis as any).__DOGS_CACHE__ = (globalThis as any).__DOGS_CACHE__ || new Map<string, { data: any; exp: number }>();
-      const cacheKey = `q:${JSON.stringify(providerParams)}`;
-      const cache = (globalThis as any).__DOGS_CACHE__ as Map<string, { data: any; exp: number }>;
-      const now = Date.now();
       // Write-through cache
       const payload = { items: dogs, page: currentPage, pageSize, total };
-      cache.set(cacheKey, { data: payload, exp: now + 60_000 });
+      const body = JSON.stringify(payload);
+      if (!partial) {
+        cache.set(cacheKey, body, jitteredTtl(DOGS_CACHE_TTL_MS));
+      }
       responseHeaders.set('X-Cache', 'MISS');
       
-      // V2: Trigger batch inference asynchronously (don't block response)
+      // V2: Trigger batch inference after the response is sent (don't block it).
+      // after() keeps the work alive past the response on serverless, where a
+      // bare fire-and-forget promise can be frozen or dropped mid-flight.
       if (dogs.length > 0) {
-        // Fire and forget - run in background using Promise (works in both Node and Edge)
-        Promise.resolve().then(async () => {
+        after(async () => {
           try {
             // Transform provider Dogs to SchemaDog format for inference
             const dogsForInference: SchemaDog[] = (dogs as ProviderDog[]).map((dog) => ({
@@ -92,40 +190,49 @@ export async function GET(request: NextRequest) {
               rawDescription: dog.description || undefined
             }));
             
-            // Filter dogs that need inference (have description, don't have cached traits)
-            const dogsNeedingInference: SchemaDog[] = [];
-            for (const dog of dogsForInference) {
-              const description = dog.rawDescription || '';
-              if (description.trim().length > 0) {
-                // Check if we already have inferred traits
-                const existing = await getInferredTraits(dog.id);
-                if (!existing) {
-                  dogsNeedingInference.push(dog);
-                }
-              }
-            }
+            // Filter dogs that need inference (have description, don't have cached traits).
+            // One batched lookup instead of a sequential round trip per dog.
+            const dogsWithDescriptions = dogsForInference.filter(
+              (dog) => (dog.rawDescription || '').trim().length > 0
+            );
+            const existingTraits = await getInferredTraitsBatch(
+              dogsWithDescriptions.map((dog) => dog.id)
+            );
+            const dogsNeedingInference: SchemaDog[] = dogsWithDescriptions.filter(
+              (dog) => !existingTraits.has(dog.id)
+            );
             
             if (dogsNeedingInference.length > 0) {
               console.log(`[${requestId}] 🔍 Batch inferring traits for ${dogsNeedingInference.length} dogs...`);
               const inferredMap = await inferDogTraitsBatch(dogsNeedingInference, 10);
               
-              // Store results
-              for (const [dogId, traits] of inferredMap.entries()) {
-                await storeInferredTraits(dogId, traits);
-              }
+              // Store results concurrently
+              const storeResults = await Promise.allSettled(
+                Array.from(inferredMap.entries()).map(([dogId, traits]) =>
+                  storeInferredTraits(dogId, traits)
+                )
+              );
+              const storeFailures = storeResults.filter(
+                (r): r is PromiseRejectedResult => r.status === 'rejected'
+              );
               
-              console.log(`[${requestId}] ✅ Stored inferred traits for ${inferredMap.size} dogs`);
+              console.log(`[${requestId}] ✅ Stored inferred traits for ${storeResults.length - storeFailures.length} dogs`);
+              if (storeFailures.length > 0) {
+                console.error(
+                  `[${requestId}] ⚠️ Failed to store inferred traits for ${storeFailures.length} dogs:`,
+                  storeFailures[0].reason
+                );
+              }
             }
           } catch (error) {
             console.error(`[${requestId}] ⚠️ Background trait inference failed:`, error);
-            // Don't throw - this is fire-and-forget
+            // Don't throw - this runs after the response is sent
           }
-        }).catch(() => {
-          // Silently handle any promise rejection
         });
       }
       
-      return NextResponse.json(payload, { headers: responseHeaders });
+      responseHeaders.set('Content-Type', 'application/json');
+      return new NextResponse(body, { headers: responseHeaders });
     } catch {
       // If cache fails, still return the payload
       const payload = { items: dogs, page: currentPage, pageSize, total };
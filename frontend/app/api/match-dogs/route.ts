@@ -111,11 +111,17 @@ export async function POST(request: NextRequest) {
 }
 
 // Health check endpoint
+// Health payload never changes; serialize it once at module load.
+// (A Response body can only be read once, so the response itself is built per call.)
+const HEALTH_BODY = JSON.stringify({
+  status: 'healthy',
+  endpoint: 'match-dogs',
+  version: '2.0.0',
+  description: 'AI-powered dog matching with deterministic scoring and LLM explanations'
+});
+
 export async function GET() {
-  return NextResponse.json({
-    status: 'healthy',
-    endpoint: 'match-dogs',
-    version: '2.0.0',
-    description: 'AI-powered dog matching with deterministic scoring and LLM explanations'
+  return new NextResponse(HEALTH_BODY, {
+    headers: { 'Content-Type': 'application/json' },
   });
 }
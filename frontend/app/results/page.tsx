@@ -337,6 +337,19 @@ function DogCard({ dog, onPhotoClick, userPreferences, analysis }: { dog: APIDog
   );
 }
 
+// Create a fingerprint for de-duplication (frontend safety net).
+// Lowercases the joined fields once and separates them with a single control
+// character, which can't appear in listing text, instead of "|||".
+function createDogFingerprint(dog: APIDog): string {
+  return [
+    (dog.name || '').trim(),
+    dog.breeds.join(','),
+    (dog.age || '').trim(),
+    (dog.size || '').trim(),
+    (dog.gender || '').trim(),
+  ].join('\u001f').toLowerCase();
+}
+
 function ResultsPageContent() {
   const searchParams = useSearchParams();
   const router = useRouter();
@@ -615,17 +628,6 @@ function ResultsPageContent() {
     }
   };
 
-  // Create a fingerprint for de-duplication (frontend safety net)
-  const createDogFingerprint = (dog: APIDog): string => {
-    const name = (dog.name || '').trim().toLowerCase();
-    const breeds = dog.breeds.join(',').toLowerCase();
-    const age = (dog.age || '').trim().toLowerCase();
-    const size = (dog.size || '').trim().toLowerCase();
-    const gender = (dog.gender || '').trim().toLowerCase();
-    
-    return `${name}|||${breeds}|||${age}|||${size}|||${gender}`;
-  };
-
   // Fetch dogs data
   useEffect(() => {
     async function fetchDogs() {
@@ -635,9 +637,16 @@ function ResultsPageContent() {
         
         const response = await listDogs(searchQuery);
         
-        // Frontend de-duplication as safety net
+        // Frontend de-duplication as safety net. Repeated ids are rejected
+        // before building a fingerprint; the fingerprint only has to catch
+        // the rarer case of one dog re-listed under a different id.
+        const seenIds = new Set<string>();
         const seenFingerprints = new Set<string>();
         const uniqueDogs = response.items.filter(dog => {
+          if (dog.id) {
+            if (seenIds.has(dog.id)) return false;
+            seenIds.add(dog.id);
+          }
           const fingerprint = createDogFingerprint(dog);
           if (seenFingerprints.has(fingerprint)) {
             return false;
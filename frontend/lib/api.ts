@@ -15,7 +15,7 @@ export interface Dog {
   size: string;
   gender: string;
   photos: string[];
-  publishedAt: string;
+  publishedAt?: string;
   location: {
     distanceMi: number;
     city?: string;
@@ -59,17 +59,16 @@ function getRatelimit(config: RateLimitConfig): Ratelimit | null {
   if (!redis) return null;
 
   const cacheKey = `${config.maxRequests}:${config.windowMs}`;
-  if (!_ratelimitCache.has(cacheKey)) {
-    _ratelimitCache.set(
-      cacheKey,
-      new Ratelimit({
-        redis,
-        limiter: Ratelimit.slidingWindow(config.maxRequests, msToDuration(config.windowMs)),
-        prefix: 'rl',
-      })
-    );
+  let ratelimit = _ratelimitCache.get(cacheKey);
+  if (!ratelimit) {
+    ratelimit = new Ratelimit({
+      redis,
+      limiter: Ratelimit.slidingWindow(config.maxRequests, msToDuration(config.windowMs)),
+      prefix: 'rl',
+    });
+    _ratelimitCache.set(cacheKey, ratelimit);
   }
-  return _ratelimitCache.get(cacheKey)!;
+  return ratelimit;
 }
 
 // ---------------------------------------------------------------------------
@@ -0,0 +1,42 @@
+/**
+ * Small in-process TTL cache with least-recently-used eviction.
+ *
+ * Map insertion order doubles as recency order: hits are re-inserted at the
+ * end, expired entries are dropped when read, and writes past `maxEntries`
+ * evict from the front. Keeps long-lived serverless instances bounded without
+ * a background sweeper.
+ */
+export class TtlLruCache<V> {
+  private readonly entries = new Map<string, { value: V; exp: number }>();
+
+  constructor(private readonly maxEntries: number) {}
+
+  get size(): number {
+    return this.entries.size;
+  }
+
+  get(key: string): V | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+    this.entries.delete(key);
+    if (entry.exp <= Date.now()) return undefined;
+    this.entries.set(key, entry);
+    return entry.value;
+  }
+
+  set(key: string, value: V, ttlMs: number): void {
+    this.entries.delete(key);
+    this.entries.set(key, { value, exp: Date.now() + ttlMs });
+    while (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value as string);
+    }
+  }
+}
+
+/**
+ * Spread expiries ±15% around the base TTL so entries written together
+ * (cold start, traffic spike) don't all expire and refetch at once.
+ */
+export function jitteredTtl(baseMs: number): number {
+  return Math.round(baseMs * (0.85 + Math.random() * 0.3));
+}
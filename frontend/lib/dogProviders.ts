@@ -2,6 +2,7 @@ import { sanitizeDescription } from './utils/description-sanitizer';
 import { normalizeDogGender } from './utils/pronouns';
 import { validateUrl } from './utils/validate-url';
 import type { Dog } from './api';
+import { TtlLruCache } from './cache/ttl-lru';
 
 /**
  * Provider identifiers – keep Petfinder around but inactive by default so
@@ -26,12 +27,14 @@ export interface DogsPage {
   page: number;
   pageSize: number;
   total: number;
+  /** Some upstream sub-calls failed; items are incomplete and shouldn't be cached */
+  partial?: boolean;
 }
 
 export interface DogProvider {
   id: DogProviderId;
   searchDogs(params: SearchDogsParams): Promise<DogsPage>;
-  getDogById(id: string): Promise<Dog | null>;
+  getDogById(id: string, options?: { signal?: AbortSignal }): Promise<Dog | null>;
 }
 
 /**
@@ -84,6 +87,30 @@ interface RescueGroupsSearchResponse {
   meta?: { pagination?: { total?: number; count?: number; current_page?: number } };
 }
 
+// Per-animal and per-response diagnostics are only useful locally; in
+// production they run for every dog on every search.
+const DEBUG_PROVIDER = process.env.NODE_ENV === 'development';
+
+function debugLog(...args: unknown[]): void {
+  if (DEBUG_PROVIDER) console.log(...args);
+}
+
+/**
+ * Normalize a CSV string param into a list of non-empty, trimmed values in a
+ * single pass. Arrays are used as-is: /api/dogs already hands them over
+ * canonicalized (trimmed, lowercased, deduped), so they aren't re-parsed here.
+ */
+function toList(value?: string | string[]): string[] {
+  if (!value) return [];
+  if (Array.isArray(value)) return value;
+  const out: string[] = [];
+  for (const part of String(value).split(',')) {
+    const trimmed = part.trim();
+    if (trimmed) out.push(trimmed);
+  }
+  return out;
+}
+
 function getRescueGroupsConfig() {
   const apiKey = process.env.RESCUEGROUPS_API_KEY;
   const baseUrl = process.env.RESCUEGROUPS_BASE_URL || 'https://api.rescuegroups.org/v5';
@@ -95,6 +122,22 @@ function getRescueGroupsConfig() {
   return { apiKey, baseUrl };
 }
 
+// Strip query params (like ?width=500) to avoid conflicts with Vercel image optimization
+function stripQueryParams(url: string): string {
+  try {
+    const parsed = new URL(url);
+    return parsed.origin + parsed.pathname;
+  } catch {
+    return url.split('?')[0];
+  }
+}
+
+function getPictureUrl(sizeObj: any): string | null {
+  if (!sizeObj) return null;
+  const url = typeof sizeObj === 'string' ? sizeObj : sizeObj.url;
+  return url ? stripQueryParams(url) : null;
+}
+
 function mapRescueGroupsAnimalToDog(
   animal: RescueGroupsAnimal,
   indexes?: {
@@ -120,27 +163,10 @@ function mapRescueGroupsAnimalToDog(
         console.warn(`[RescueGroups] Picture ${ref.id} not found in included array`);
         return;
       }
-      // RescueGroups schema: pictures have large, original, small as objects with url property
-      // Strip query params (like ?width=500) to avoid conflicts with Vercel image optimization
-      const stripQueryParams = (url: string) => {
-        try {
-          const parsed = new URL(url);
-          return parsed.origin + parsed.pathname;
-        } catch {
-          return url.split('?')[0];
-        }
-      };
-      const getUrl = (sizeObj: any) => {
-        if (!sizeObj) return null;
-        const url = typeof sizeObj === 'string' ? sizeObj : sizeObj.url;
-        return url ? stripQueryParams(url) : null;
-      };
-      const largeUrl = getUrl(pic.large);
-      const originalUrl = getUrl(pic.original);
-      const smallUrl = getUrl(pic.small);
-      if (largeUrl) photos.push(largeUrl);
-      else if (originalUrl) photos.push(originalUrl);
-      else if (smallUrl) photos.push(smallUrl);
+      // RescueGroups schema: pictures have large, original, small as objects with url property.
+      // Take the first size that has a URL rather than normalizing all three.
+      const pictureUrl = getPictureUrl(pic.large) || getPictureUrl(pic.original) || getPictureUrl(pic.small);
+      if (pictureUrl) photos.push(pictureUrl);
       else {
         console.warn(`[RescueGroups] Picture ${ref.id} has no valid URL:`, pic);
       }
@@ -151,24 +177,23 @@ function mapRescueGroupsAnimalToDog(
     );
   }
 
-  // Pull city/state from the org (shelter) since animals don't carry location fields
-  let orgCity: string | undefined;
-  let orgState: string | undefined;
+  // Resolve the animal's org once; location, adoption URL fallback and
+  // shelter contact all read from it.
+  // The actual relationship name is "orgs" (plural) and it's an array
   let orgId: string | undefined;
   if (rel.orgs?.data && Array.isArray(rel.orgs.data) && rel.orgs.data.length > 0 && rel.orgs.data[0]?.id) {
+    // orgs.data is an array, take the first one
     orgId = String(rel.orgs.data[0].id);
   } else if (rel.organization?.data?.id) {
     orgId = String(rel.organization.data.id);
   } else if (rel.org?.data?.id) {
     orgId = String(rel.org.data.id);
   }
-  if (orgId && indexes?.orgsById) {
-    const org = indexes.orgsById.get(orgId);
-    if (org) {
-      orgCity = org.city || undefined;
-      orgState = org.state || undefined;
-    }
-  }
+  const org = orgId ? indexes?.orgsById?.get(orgId) : undefined;
+
+  // Pull city/state from the org (shelter) since animals don't carry location fields
+  const orgCity: string | undefined = org?.city || undefined;
+  const orgState: string | undefined = org?.state || undefined;
 
   const sanitizedDescription = sanitizeDescription(attrs.descriptionText);
 
@@ -184,7 +209,8 @@ function mapRescueGroupsAnimalToDog(
     size: (attrs.sizeGroup || 'Unknown').toLowerCase(),
     gender: genderLabel,
     photos,
-    publishedAt: attrs.publishedDate || new Date().toISOString(),
+    // Leave undated listings undated; a stand-in 'now' would read as freshly published
+    publishedAt: attrs.publishedDate || undefined,
     location: {
       distanceMi: attrs.distance || 0,
     },
@@ -193,48 +219,38 @@ function mapRescueGroupsAnimalToDog(
     tags: [],
     url: (() => {
       // Try animal's direct adoption URL first
-      console.log(`[RescueGroups] Animal ${animal.id} attrs.adoptionUrl:`, attrs.adoptionUrl, 'attrs.url:', attrs.url);
+      debugLog(`[RescueGroups] Animal ${animal.id} attrs.adoptionUrl:`, attrs.adoptionUrl, 'attrs.url:', attrs.url);
       if (attrs.adoptionUrl) {
-        console.log(`[RescueGroups] Using animal adoptionUrl for ${animal.id}:`, attrs.adoptionUrl);
+        debugLog(`[RescueGroups] Using animal adoptionUrl for ${animal.id}:`, attrs.adoptionUrl);
         return attrs.adoptionUrl;
       }
       // Try animal's general URL field
       if (attrs.url) {
-        console.log(`[RescueGroups] Using animal url for ${animal.id}:`, attrs.url);
+        debugLog(`[RescueGroups] Using animal url for ${animal.id}:`, attrs.url);
         return attrs.url;
       }
       
-      // Try to find organization relationship - check multiple possible field names
-      // The actual relationship name is "orgs" (plural) and it's an array
-      let orgId: string | undefined;
-      
-      if (rel.orgs?.data && Array.isArray(rel.orgs.data) && rel.orgs.data.length > 0 && rel.orgs.data[0]?.id) {
-        // orgs.data is an array, take the first one
-        orgId = String(rel.orgs.data[0].id);
-      } else if (rel.organization?.data?.id) {
-        orgId = String(rel.organization.data.id);
-      } else if (rel.org?.data?.id) {
-        orgId = String(rel.org.data.id);
-      } else if (attrs.organizationId) {
-        orgId = String(attrs.organizationId);
-      } else if (attrs.orgId) {
-        orgId = String(attrs.orgId);
+      // Fall back to org id attributes when there's no org relationship
+      let urlOrgId = orgId;
+      let urlOrg = org;
+      if (!urlOrgId && (attrs.organizationId || attrs.orgId)) {
+        urlOrgId = String(attrs.organizationId || attrs.orgId);
+        urlOrg = indexes?.orgsById?.get(urlOrgId);
       }
       
-      if (orgId && indexes?.orgsById) {
-        const org = indexes.orgsById.get(orgId);
-        if (org) {
+      if (urlOrgId && indexes?.orgsById) {
+        if (urlOrg) {
           // Try adoptionUrl first
-          if (org.adoptionUrl) {
-            console.log(`[RescueGroups] Using org adoptionUrl for animal ${animal.id} (org ${orgId}):`, org.adoptionUrl);
-            return org.adoptionUrl;
+          if (urlOrg.adoptionUrl) {
+            debugLog(`[RescueGroups] Using org adoptionUrl for animal ${animal.id} (org ${urlOrgId}):`, urlOrg.adoptionUrl);
+            return urlOrg.adoptionUrl;
           }
           // Fallback to org's general website URL
-          if (org.url) {
-            console.log(`[RescueGroups] Using org website URL for animal ${animal.id} (org ${orgId}):`, org.url);
-            return org.url;
+          if (urlOrg.url) {
+            debugLog(`[RescueGroups] Using org website URL for animal ${animal.id} (org ${urlOrgId}):`, urlOrg.url);
+            return urlOrg.url;
           }
-          console.log(`[RescueGroups] Org ${orgId} has no adoptionUrl or url, org data:`, org);
+          debugLog(`[RescueGroups] Org ${urlOrgId} has no adoptionUrl or url, org data:`, urlOrg);
         }
       } else {
         console.error(`[RescueGroups] ERROR: No org ID found for animal ${animal.id}. Available relationships:`, Object.keys(rel || {}));
@@ -244,34 +260,114 @@ function mapRescueGroupsAnimalToDog(
       console.error(`[RescueGroups] ERROR: No adoption URL found for animal ${animal.id}`);
       return '';
     })(),
-    shelter: (() => {
-      let name = 'Unknown Shelter';
-      // Use orgs relationship (plural, array)
-      let orgId: string | undefined;
-      if (rel.orgs?.data && Array.isArray(rel.orgs.data) && rel.orgs.data.length > 0 && rel.orgs.data[0]?.id) {
-        orgId = String(rel.orgs.data[0].id);
-      } else if (rel.organization?.data?.id) {
-        orgId = String(rel.organization.data.id);
-      } else if (rel.org?.data?.id) {
-        orgId = String(rel.org.data.id);
-      }
-      
-      let email = '';
-      let phone = '';
-      if (orgId && indexes?.orgsById) {
-        const org = indexes.orgsById.get(orgId);
-        if (org) {
-          name = org.name || name;
-          email = org.email || '';
-          phone = org.phone || '';
-        }
-      }
-      return { name, email, phone };
-    })(),
+    shelter: {
+      name: org?.name || 'Unknown Shelter',
+      email: org?.email || '',
+      phone: org?.phone || '',
+    },
     description: sanitizedDescription || undefined,
   };
 }
 
+/**
+ * Build the `included` lookup maps that mapRescueGroupsAnimalToDog resolves
+ * picture/org/breed relationships against.
+ */
+function indexIncluded(included: RescueGroupsSearchResponse['included']) {
+  const picturesById = new Map<string, any>();
+  const orgsById = new Map<string, any>();
+  const breedsById = new Map<string, any>();
+  if (Array.isArray(included)) {
+    for (const inc of included) {
+      const id = String(inc.id);
+      if (inc.type === 'pictures') picturesById.set(id, inc.attributes);
+      else if (inc.type === 'orgs') orgsById.set(id, inc.attributes);
+      else if (inc.type === 'breeds' || inc.type === 'breed') breedsById.set(id, inc.attributes);
+    }
+  }
+  return { picturesById, orgsById, breedsById };
+}
+
+// Gateway errors from RescueGroups are usually momentary; retry them briefly
+// here so every caller gets the same policy.
+const RETRYABLE_STATUSES = new Set([502, 503, 504]);
+const MAX_SEARCH_ATTEMPTS = 3;
+const RETRY_BACKOFF_MS = 300;
+
+/**
+ * POST a search body to the available-dogs endpoint with the include/fields
+ * set every caller needs. `label` tags the error message with the caller.
+ * Retries 502/503/504 responses with exponential backoff (300ms, 600ms);
+ * timeouts and other errors fail immediately. Aborting `signal` stops any
+ * in-flight attempt and further retries, so a caller that gives up doesn't
+ * leave retries running behind it. Status errors carry `status`.
+ */
+async function postAnimalSearch(
+  baseUrl: string,
+  apiKey: string,
+  body: unknown,
+  label?: string,
+  signal?: AbortSignal
+): Promise<RescueGroupsSearchResponse> {
+  const url = new URL(`${baseUrl}/public/animals/search/available/dogs`);
+  url.searchParams.set('include', 'pictures,orgs,breeds');
+  // Request adoptionUrl along with all essential fields (don't limit to just adoptionUrl)
+  url.searchParams.set('fields[animals]', 'name,ageGroup,sizeGroup,sex,descriptionText,publishedDate,distance,adoptionUrl,url,breedPrimary,breedSecondary');
+  // No longer requesting location fields - we only use distance
+  url.searchParams.set('fields[orgs]', 'name,adoptionUrl,url,email,phone,city,state'); // email/phone for fallback contact; city/state for location display
+  url.searchParams.set('fields[breeds]', 'name');
+  const requestUrl = url.toString();
+  const requestBody = JSON.stringify(body);
+
+  for (let attempt = 1; ; attempt++) {
+    signal?.throwIfAborted();
+    const controller = new AbortController();
+    const timeoutId = setTimeout(() => controller.abort(), 20000);
+    const abortAttempt = () => controller.abort();
+    signal?.addEventListener('abort', abortAttempt, { once: true });
+
+    const resp = await fetch(requestUrl, {
+      method: 'POST',
+      headers: {
+        'Content-Type': 'application/vnd.api+json',
+        Authorization: apiKey,
+      },
+      body: requestBody,
+      cache: 'no-store',
+      signal: controller.signal,
+    }).finally(() => {
+      clearTimeout(timeoutId);
+      signal?.removeEventListener('abort', abortAttempt);
+    });
+
+    if (resp.ok) {
+      return (await resp.json()) as RescueGroupsSearchResponse;
+    }
+
+    if (RETRYABLE_STATUSES.has(resp.status) && attempt < MAX_SEARCH_ATTEMPTS) {
+      await resp.body?.cancel().catch(() => {});
+      debugLog(`[RescueGroups] ${resp.status} on attempt ${attempt}/${MAX_SEARCH_ATTEMPTS}, retrying`);
+      await new Promise((resolve) => setTimeout(resolve, RETRY_BACKOFF_MS * 2 ** (attempt - 1)));
+      continue;
+    }
+
+    const txt = await resp.text().catch(() => '');
+    throw Object.assign(
+      new Error(
+        `RescueGroups API error${label ? ` (${label})` : ''}: ${resp.status} ${resp.statusText} ${txt.substring(0, 300)}`,
+      ),
+      { status: resp.status },
+    );
+  }
+}
+
+// Sub-call results for multi-value (age/size) searches, keyed without page
+const MERGED_SEARCH_TTL_MS = 60_000;
+const MERGED_SEARCH_MAX_ENTRIES = 200;
+const mergedSearchCache = new TtlLruCache<{ lists: Dog[][]; publishedMs: number[][]; total: number; partial: boolean }>(
+  MERGED_SEARCH_MAX_ENTRIES
+);
+
 export class RescueGroupsDogProvider implements DogProvider {
   id: DogProviderId = 'rescuegroups';
 
@@ -282,23 +378,8 @@ export class RescueGroupsDogProvider implements DogProvider {
     const limit = Math.min(params.limit || 20, 50);
 
     // Parse age and size parameters
-    const ages = params.age
-      ? (Array.isArray(params.age)
-          ? params.age.filter((a) => !!a)
-          : String(params.age)
-              .split(',')
-              .map((a) => a.trim())
-              .filter(Boolean))
-      : [];
-    
-    const sizes = params.size
-      ? (Array.isArray(params.size)
-          ? params.size.filter((s) => !!s)
-          : String(params.size)
-              .split(',')
-              .map((s) => s.trim())
-              .filter(Boolean))
-      : [];
+    const ages = toList(params.age);
+    const sizes = toList(params.size);
 
     // If we have multiple values for age or size, make separate API calls
     // and merge results, since RescueGroups API doesn't support OR operations natively
@@ -306,73 +387,112 @@ export class RescueGroupsDogProvider implements DogProvider {
     const hasMultipleSizes = sizes.length > 1;
 
     if (hasMultipleAges || hasMultipleSizes) {
-      const allResults: Dog[] = [];
-      const seenIds = new Set<string>();
-
-      let calls: Promise<DogsPage>[] = [];
-
-      if (hasMultipleAges && hasMultipleSizes) {
-        // Both have multiple values - iterate over ages, then sizes for each age
-        // This creates age.length calls, each with a single size value
-        for (const age of ages) {
-          for (const size of sizes) {
-            calls.push(this.makeSingleSearchCall({
+      // Every page of the same search merges the same sub-call results, so
+      // keep them (keyed without page) briefly and let pagination re-slice.
+      const mergeKey = JSON.stringify([params.zip ?? '', params.radius ?? '', ages, sizes, limit]);
+      let merge = mergedSearchCache.get(mergeKey);
+
+      if (!merge) {
+        let calls: Promise<DogsPage>[] = [];
+
+        if (hasMultipleAges && hasMultipleSizes) {
+          // Both have multiple values - iterate over ages, then sizes for each age
+          // This creates age.length calls, each with a single size value
+          for (const age of ages) {
+            for (const size of sizes) {
+              calls.push(this.makeSingleSearchCall({
+                ...params,
+                age: [age],
+                size: [size],
+              }, apiKey, baseUrl, 1, limit * 2));
+            }
+          }
+        } else if (hasMultipleAges) {
+          // Only age has multiple values - one call per age, keep size constant
+          calls = ages.map((age) => 
+            this.makeSingleSearchCall({
               ...params,
               age: [age],
+              // size stays as-is (single value or undefined)
+            }, apiKey, baseUrl, 1, limit * 2)
+          );
+        } else {
+          // Only size has multiple values - one call per size, keep age constant
+          calls = sizes.map((size) => 
+            this.makeSingleSearchCall({
+              ...params,
               size: [size],
-            }, apiKey, baseUrl, 1, limit * 2));
-          }
+              // age stays as-is (single value or undefined)
+            }, apiKey, baseUrl, 1, limit * 2)
+          );
         }
-      } else if (hasMultipleAges) {
-        // Only age has multiple values - one call per age, keep size constant
-        calls = ages.map((age) => 
-          this.makeSingleSearchCall({
-            ...params,
-            age: [age],
-            // size stays as-is (single value or undefined)
-          }, apiKey, baseUrl, 1, limit * 2)
-        );
-      } else {
-        // Only size has multiple values - one call per size, keep age constant
-        calls = sizes.map((size) => 
-          this.makeSingleSearchCall({
-            ...params,
-            size: [size],
-            // age stays as-is (single value or undefined)
-          }, apiKey, baseUrl, 1, limit * 2)
-        );
-      }
 
-      const results = await Promise.allSettled(calls);
-      for (const result of results) {
-        if (result.status === 'fulfilled') {
-          for (const dog of result.value.items) {
-            // Deduplicate by ID to handle any overlap between calls
-            if (!seenIds.has(dog.id)) {
+        const results = await Promise.allSettled(calls);
+        // Nothing came back: surface the failure rather than an empty page
+        const firstFailure = results.find((r): r is PromiseRejectedResult => r.status === 'rejected');
+        if (firstFailure && results.every((r) => r.status === 'rejected')) {
+          throw firstFailure.reason;
+        }
+
+        const lists: Dog[][] = [];
+        const seenIds = new Set<string>();
+        for (const result of results) {
+          if (result.status === 'fulfilled') {
+            lists.push(result.value.items);
+            for (const dog of result.value.items) {
+              // Count distinct IDs for the total; calls can overlap
               seenIds.add(dog.id);
-              allResults.push(dog);
             }
           }
         }
-      }
 
-      // Sort by published date (most recent first)
-      allResults.sort((a, b) => {
-        const dateA = new Date(a.publishedAt || 0).getTime();
-        const dateB = new Date(b.publishedAt || 0).getTime();
-        return dateB - dateA;
-      });
+        // Parse each date once so merges (including cached re-merges) compare numbers
+        const publishedMs = lists.map((items) =>
+          items.map((dog) => new Date(dog.publishedAt || 0).getTime())
+        );
+        merge = { lists, publishedMs, total: seenIds.size, partial: lists.length < calls.length };
 
-      // Apply pagination
+        // Don't pin a partial result set if any sub-call failed
+        if (!merge.partial) {
+          mergedSearchCache.set(mergeKey, merge, MERGED_SEARCH_TTL_MS);
+        }
+      }
+
+      // Every call is already sorted by publishedDate desc, so merge the
+      // lists head-by-head (most recent first) and stop once the requested
+      // page is filled instead of sorting everything.
+      const { lists, publishedMs } = merge;
+      const allResults: Dog[] = [];
+      const heads = lists.map(() => 0);
+      const emittedIds = new Set<string>();
       const startIndex = (page - 1) * limit;
       const endIndex = startIndex + limit;
+
+      while (allResults.length < endIndex) {
+        let best = -1;
+        for (let i = 0; i < lists.length; i++) {
+          if (heads[i] >= lists[i].length) continue;
+          if (best === -1 || publishedMs[i][heads[i]] > publishedMs[best][heads[best]]) {
+            best = i;
+          }
+        }
+        if (best === -1) break;
+
+        const dog = lists[best][heads[best]++];
+        if (emittedIds.has(dog.id)) continue;
+        emittedIds.add(dog.id);
+        allResults.push(dog);
+      }
+
+      // Apply pagination
       const paginatedResults = allResults.slice(startIndex, endIndex);
 
       return {
         items: paginatedResults,
         page,
         pageSize: paginatedResults.length,
-        total: allResults.length,
+        total: merge.total,
+        ...(merge.partial ? { partial: true } : {}),
       };
     }
 
@@ -389,36 +509,22 @@ export class RescueGroupsDogProvider implements DogProvider {
   ): Promise<DogsPage> {
     const filters: any[] = [];
     
-    if (params.age) {
-      const ages = Array.isArray(params.age)
-        ? params.age.filter((a) => !!a)
-        : String(params.age)
-            .split(',')
-            .map((a) => a.trim())
-            .filter(Boolean);
-      if (ages.length > 0) {
-        filters.push({
-          fieldName: 'animals.ageGroup',
-          operation: 'equals',
-          criteria: ages[0], // Single value only in this path
-        });
-      }
+    const ages = toList(params.age);
+    if (ages.length > 0) {
+      filters.push({
+        fieldName: 'animals.ageGroup',
+        operation: 'equals',
+        criteria: ages[0], // Single value only in this path
+      });
     }
     
-    if (params.size) {
-      const sizes = Array.isArray(params.size)
-        ? params.size.filter((s) => !!s)
-        : String(params.size)
-            .split(',')
-            .map((s) => s.trim())
-            .filter(Boolean);
-      if (sizes.length > 0) {
-        filters.push({
-          fieldName: 'animals.sizeGroup',
-          operation: 'equals',
-          criteria: sizes[0], // Single value only in this path
-        });
-      }
+    const sizes = toList(params.size);
+    if (sizes.length > 0) {
+      filters.push({
+        fieldName: 'animals.sizeGroup',
+        operation: 'equals',
+        criteria: sizes[0], // Single value only in this path
+      });
     }
 
     const body: any = {
@@ -446,77 +552,39 @@ export class RescueGroupsDogProvider implements DogProvider {
       };
     }
 
-    const controller = new AbortController();
-    const timeoutId = setTimeout(() => controller.abort(), 20000);
-
-    const url = new URL(`${baseUrl}/public/animals/search/available/dogs`);
-    url.searchParams.set('include', 'pictures,orgs,breeds');
-    // Request adoptionUrl along with all essential fields (don't limit to just adoptionUrl)
-    url.searchParams.set('fields[animals]', 'name,ageGroup,sizeGroup,sex,descriptionText,publishedDate,distance,adoptionUrl,url,breedPrimary,breedSecondary');
-    // No longer requesting location fields - we only use distance
-    url.searchParams.set('fields[orgs]', 'name,adoptionUrl,url,email,phone,city,state'); // email/phone for fallback contact; city/state for location display
-    url.searchParams.set('fields[breeds]', 'name');
-
-    const resp = await fetch(url.toString(), {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/vnd.api+json',
-        Authorization: apiKey,
-      },
-      body: JSON.stringify(body),
-      cache: 'no-store',
-      signal: controller.signal,
-    }).finally(() => clearTimeout(timeoutId));
-
-    if (!resp.ok) {
-      const txt = await resp.text().catch(() => '');
-      throw new Error(
-        `RescueGroups API error: ${resp.status} ${resp.statusText} ${txt.substring(0, 300)}`,
-      );
-    }
-
-    const json = (await resp.json()) as RescueGroupsSearchResponse;
+    const json = await postAnimalSearch(baseUrl, apiKey, body);
     const animals = Array.isArray(json.data) ? json.data : [];
-
-    const picturesById = new Map<string, any>();
-    const orgsById = new Map<string, any>();
-    const breedsById = new Map<string, any>();
-    if (Array.isArray(json.included)) {
-      for (const inc of json.included) {
-        const id = String(inc.id);
-        if (inc.type === 'pictures') picturesById.set(id, inc.attributes);
-        else if (inc.type === 'orgs') orgsById.set(id, inc.attributes);
-        else if (inc.type === 'breeds' || inc.type === 'breed') breedsById.set(id, inc.attributes);
-      }
-    }
+    const { picturesById, orgsById, breedsById } = indexIncluded(json.included);
 
     // Debug logging to diagnose photo mapping issues
-    const sampleAnimal = animals[0];
-    console.log('[RescueGroups] Response summary:', {
-      animalsCount: animals.length,
-      includedCount: Array.isArray(json.included) ? json.included.length : 0,
-      picturesIncluded: Array.isArray(json.included)
-        ? json.included.filter((i) => i.type === 'pictures').length
-        : 0,
-      orgsIncluded: Array.isArray(json.included)
-        ? json.included.filter((i) => i.type === 'orgs').length
-        : 0,
-      picturesByIdSize: picturesById.size,
-      orgsByIdSize: orgsById.size,
-      sampleAnimal: sampleAnimal
-        ? {
-            id: sampleAnimal.id,
-            hasPicturesRel: !!sampleAnimal.relationships?.pictures?.data,
-            picturesRelCount: Array.isArray(sampleAnimal.relationships?.pictures?.data)
-              ? sampleAnimal.relationships.pictures.data.length
-              : 0,
-            hasOrgRel: !!sampleAnimal.relationships?.organization?.data,
-            orgRelId: sampleAnimal.relationships?.organization?.data?.id,
-            allRelationships: Object.keys(sampleAnimal.relationships || {}),
-            relationshipsFull: sampleAnimal.relationships,
-          }
-        : null,
-    });
+    if (DEBUG_PROVIDER) {
+      const sampleAnimal = animals[0];
+      console.log('[RescueGroups] Response summary:', {
+        animalsCount: animals.length,
+        includedCount: Array.isArray(json.included) ? json.included.length : 0,
+        picturesIncluded: Array.isArray(json.included)
+          ? json.included.filter((i) => i.type === 'pictures').length
+          : 0,
+        orgsIncluded: Array.isArray(json.included)
+          ? json.included.filter((i) => i.type === 'orgs').length
+          : 0,
+        picturesByIdSize: picturesById.size,
+        orgsByIdSize: orgsById.size,
+        sampleAnimal: sampleAnimal
+          ? {
+              id: sampleAnimal.id,
+              hasPicturesRel: !!sampleAnimal.relationships?.pictures?.data,
+              picturesRelCount: Array.isArray(sampleAnimal.relationships?.pictures?.data)
+                ? sampleAnimal.relationships.pictures.data.length
+                : 0,
+              hasOrgRel: !!sampleAnimal.relationships?.organization?.data,
+              orgRelId: sampleAnimal.relationships?.organization?.data?.id,
+              allRelationships: Object.keys(sampleAnimal.relationships || {}),
+              relationshipsFull: sampleAnimal.relationships,
+            }
+          : null,
+      });
+    }
 
     const mapped = animals.map((animal) =>
       mapRescueGroupsAnimalToDog(animal, { picturesById, orgsById, breedsById })
@@ -555,7 +623,7 @@ export class RescueGroupsDogProvider implements DogProvider {
     };
   }
 
-  async getDogById(id: string): Promise<Dog | null> {
+  async getDogById(id: string, options: { signal?: AbortSignal } = {}): Promise<Dog | null> {
     const { apiKey, baseUrl } = getRescueGroupsConfig();
 
     const body = {
@@ -571,70 +639,32 @@ export class RescueGroupsDogProvider implements DogProvider {
       },
     };
 
-    const controller = new AbortController();
-    const timeoutId = setTimeout(() => controller.abort(), 20000);
-
-    const url = new URL(`${baseUrl}/public/animals/search/available/dogs`);
-    url.searchParams.set('include', 'pictures,orgs,breeds');
-    // Request adoptionUrl along with all essential fields (don't limit to just adoptionUrl)
-    url.searchParams.set('fields[animals]', 'name,ageGroup,sizeGroup,sex,descriptionText,publishedDate,distance,adoptionUrl,url,breedPrimary,breedSecondary');
-    // No longer requesting location fields - we only use distance
-    url.searchParams.set('fields[orgs]', 'name,adoptionUrl,url,email,phone,city,state'); // email/phone for fallback contact; city/state for location display
-    url.searchParams.set('fields[breeds]', 'name');
-
-    const resp = await fetch(url.toString(), {
-      method: 'POST',
-      headers: {
-        'Content-Type': 'application/vnd.api+json',
-        Authorization: apiKey,
-      },
-      body: JSON.stringify(body),
-      cache: 'no-store',
-      signal: controller.signal,
-    }).finally(() => clearTimeout(timeoutId));
-
-    if (!resp.ok) {
-      const txt = await resp.text().catch(() => '');
-      throw new Error(
-        `RescueGroups API error (getDogById): ${resp.status} ${resp.statusText} ${txt.substring(
-          0,
-          300,
-        )}`,
-      );
-    }
-
-    const json = (await resp.json()) as RescueGroupsSearchResponse;
+    const json = await postAnimalSearch(baseUrl, apiKey, body, 'getDogById', options.signal);
     const animal = Array.isArray(json.data) && json.data.length > 0 ? json.data[0] : null;
     if (!animal) return null;
 
-    const picturesById = new Map<string, any>();
-    const orgsById = new Map<string, any>();
-    const breedsById = new Map<string, any>();
-    if (Array.isArray(json.included)) {
-      for (const inc of json.included) {
-        const id = String(inc.id);
-        if (inc.type === 'pictures') picturesById.set(id, inc.attributes);
-        else if (inc.type === 'orgs') orgsById.set(id, inc.attributes);
-        else if (inc.type === 'breeds' || inc.type === 'breed') breedsById.set(id, inc.attributes);
-      }
-    }
-
-    return mapRescueGroupsAnimalToDog(animal, { picturesById, orgsById, breedsById });
+    return mapRescueGroupsAnimalToDog(animal, indexIncluded(json.included));
   }
 }
 
+// Memoized provider instance, reused across requests
+let providerInstance: DogProvider | null = null;
+
 /**
  * Simple provider factory – today we only support RescueGroups as the active
  * provider, but we keep the Petfinder identifier around for future use.
  */
 export function getActiveDogProvider(): DogProvider {
+  if (providerInstance) return providerInstance;
+
   const configured = (process.env.DOG_PROVIDER || 'rescuegroups') as DogProviderId;
 
   switch (configured) {
     case 'rescuegroups':
     default:
-      return new RescueGroupsDogProvider();
+      providerInstance = new RescueGroupsDogProvider();
   }
+  return providerInstance;
 }
 
 
@@ -1,5 +1,8 @@
 import { Resend } from 'resend';
 
+// Memoized Resend client instance, reused across sends
+let resendInstance: Resend | null = null;
+
 // Initialize Resend client
 export function getResendClient(): Resend {
   const apiKey = process.env.RESEND_API_KEY;
@@ -9,7 +12,28 @@ export function getResendClient(): Resend {
     throw new Error('RESEND_API_KEY environment variable is required');
   }
   
-  return new Resend(apiKey);
+  if (!resendInstance) {
+    resendInstance = new Resend(apiKey);
+  }
+  return resendInstance;
+}
+
+// Next free Resend send slot (epoch ms), shared by every send in this process
+let nextSendSlotAt = 0;
+
+/**
+ * Pace sends to the Resend quota across all callers. Reserves the next free
+ * slot and waits only if that slot is in the future, so a lone send (or a
+ * quiet period) never sleeps, while bursts are spread out instead of tripping
+ * 429s and falling into retry backoff. Call right before `emails.send`.
+ */
+export async function acquireSendSlot(): Promise<void> {
+  const now = Date.now();
+  const slot = Math.max(now, nextSendSlotAt);
+  nextSendSlotAt = slot + 1000 / RATE_LIMITS.resendSendsPerSecond;
+  if (slot > now) {
+    await new Promise(resolve => setTimeout(resolve, slot - now));
+  }
 }
 
 // Email configuration
@@ -32,5 +56,6 @@ export const EMAIL_CONFIG = {
 export const RATE_LIMITS = {
   maxEmailsPerUserPerDay: 1, // One email per day at 12pm Eastern
   cooldownMinutes: 24 * 60, // 24 hours between emails
+  resendSendsPerSecond: 2, // Resend's default API quota is 2 requests/second per team
 } as const;
 
@@ -1,4 +1,4 @@
-import { getResendClient, EMAIL_CONFIG } from './config';
+import { getResendClient, acquireSendSlot, EMAIL_CONFIG } from './config';
 import {
   EmailTemplateData,
   EmailTemplateDataSchema,
@@ -64,6 +64,7 @@ export async function sendDogMatchAlert(
     
     // Send email via Resend
     console.log('📤 Calling Resend API to send alert to:', templateData.user.email);
+    await acquireSendSlot();
     const result = await resend.emails.send({
       from: EMAIL_CONFIG.from,
       to: [templateData.user.email],
@@ -530,6 +531,7 @@ export async function sendTestEmail(
       replyTo: EMAIL_CONFIG.replyTo,
     });
 
+    await acquireSendSlot();
     const result = await resend.emails.send({
       from: EMAIL_CONFIG.from,
       to: [to],
@@ -679,6 +681,7 @@ async function sendTestEmailWithStubData(
       replyTo: EMAIL_CONFIG.replyTo,
     });
 
+    await acquireSendSlot();
     const result = await resend.emails.send({
       from: EMAIL_CONFIG.from,
       to: [to],
@@ -1119,35 +1122,46 @@ function generateEmailText(data: EmailTemplateData): string {
   const privacyUrl = EMAIL_CONFIG.privacyUrl;
   const termsUrl = EMAIL_CONFIG.termsUrl;
   
-  let text = `Hi ${user.name || 'there'}! Here's your latest update from the yenta. 👋\n\n`;
-  text += `We found ${matches.length} new match(es) within ${preferences.radiusMi} miles.\n\n`;
+  // Collect lines and join once rather than growing one string per +=
+  const lines: string[] = [
+    `Hi ${user.name || 'there'}! Here's your latest update from the yenta. 👋`,
+    '',
+    `We found ${matches.length} new match(es) within ${preferences.radiusMi} miles.`,
+    '',
+  ];
   
   matches.forEach((dog: EmailDogMatch, i: number) => {
     const dist = dog.location.distanceMi ? ` (${Math.round(dog.location.distanceMi)} mi)` : '';
     const dogUrl = dog.url ? buildUTMUrl(dog.url, `card_${dog.id}`, prefs.frequency || 'na') : buildUTMUrl('/results', `card_${dog.id}`, prefs.frequency || 'na');
     const timeAgo = formatTimeAgo(dog.publishedAt);
     
-    text += `${i+1}. ${dog.name}\n`;
-    text += `   ${dog.breeds && dog.breeds.length ? dog.breeds.join(', ') : 'Mixed Breed'}\n`;
-    text += `   ${dist}${timeAgo ? ' · ' + timeAgo : ''}\n`;
+    lines.push(`${i+1}. ${dog.name}`);
+    lines.push(`   ${dog.breeds && dog.breeds.length ? dog.breeds.join(', ') : 'Mixed Breed'}`);
+    lines.push(`   ${dist}${timeAgo ? ' · ' + timeAgo : ''}`);
     if (dog.shelter.name) {
-      text += `   From: ${dog.shelter.name}${dist ? ' · ' + dist.trim() : ''}\n`;
+      lines.push(`   From: ${dog.shelter.name}${dist ? ' · ' + dist.trim() : ''}`);
     }
     if (dog.reasons?.primary150) {
-      text += `   Why: ${dog.reasons.primary150}\n`;
+      lines.push(`   Why: ${dog.reasons.primary150}`);
     }
-    text += `   ${dogUrl}\n\n`;
+    lines.push(`   ${dogUrl}`, '');
   });
   
-  text += `All matches: ${resultsUrl}\n`;
-  text += `Unsubscribe: ${unsubscribeUrl}\n`;
-  text += `Manage preferences: ${findUrl}\n\n`;
-  text += `Happy dog hunting! 🐕\n`;
-  text += `The DogYenta Team\n`;
-  text += `\nYou received this email because you opted in at dogyenta.com.\n`;
-  text += `${companyName}\n${physicalAddress}\n`;
-  text += `Privacy: ${privacyUrl}\n`;
-  text += `Terms: ${termsUrl}\n`;
+  lines.push(
+    `All matches: ${resultsUrl}`,
+    `Unsubscribe: ${unsubscribeUrl}`,
+    `Manage preferences: ${findUrl}`,
+    '',
+    `Happy dog hunting! 🐕`,
+    `The DogYenta Team`,
+    '',
+    `You received this email because you opted in at dogyenta.com.`,
+    companyName,
+    physicalAddress,
+    `Privacy: ${privacyUrl}`,
+    `Terms: ${termsUrl}`,
+    '',
+  );
   
-  return text;
+  return lines.join('\n');
 }
@@ -35,6 +35,11 @@ export function filterByRadius(
 export function filterByBreeds(dogs: Dog[], effectivePrefs: EffectivePreferences): Dog[] {
   const { breeds } = effectivePrefs;
   
+  // Nothing to include or exclude - skip the pass instead of copying the list
+  if (breeds.expandedInclude.length === 0 && breeds.expandedExclude.length === 0) {
+    return dogs;
+  }
+  
   return dogs.filter(dog => {
     // First, check exclusions (exclude takes precedence)
     if (breeds.expandedExclude.length > 0) {
@@ -22,6 +22,8 @@ export function getDescriptionHash(description: string): string {
 
 /**
  * Batch infer traits for multiple dogs
+ * Keeps up to `batchSize` requests in flight; as soon as one finishes the next
+ * dog starts, so a single slow response doesn't hold up the rest of a batch.
  * Returns a Map of petfinderId -> InferredTraits
  */
 export async function inferDogTraitsBatch(
@@ -39,58 +41,48 @@ export async function inferDogTraitsBatch(
     return results;
   }
   
-  // Process in batches to avoid rate limits
-  for (let i = 0; i < dogsWithDescriptions.length; i += batchSize) {
-    const batch = dogsWithDescriptions.slice(i, i + batchSize);
-    
-    // Process batch in parallel
-    const batchPromises = batch.map(async (dog) => {
-      try {
-        const description = dog.rawDescription || '';
-        const tags = dog.tags || [];
-        
-        // Resolve API URL for server-side calls
-        const apiUrl = typeof window === 'undefined' 
-          ? (() => {
-              const base = process.env.NEXT_PUBLIC_SITE_URL || process.env.VERCEL_URL || 'http://localhost:3000';
-              const normalized = String(base).startsWith('http') ? String(base) : `https://${base}`;
-              return `${normalized}/api/infer-traits`;
-            })()
-          : '/api/infer-traits';
-        
-        const response = await fetch(apiUrl, {
-          method: 'POST',
-          headers: { 'Content-Type': 'application/json' },
-          body: JSON.stringify({ description, tags }),
-        });
-        
-        if (!response.ok) {
-          console.warn(`Failed to infer traits for dog ${dog.id}: ${response.status}`);
-          return null;
-        }
-        
-        const traits: InferredTraits = await response.json();
-        return { dogId: dog.id, traits };
-      } catch (error) {
-        console.warn(`Error inferring traits for dog ${dog.id}:`, error);
-        return null;
-      }
-    });
-    
-    const batchResults = await Promise.all(batchPromises);
-    
-    // Add successful results to map
-    batchResults.forEach(result => {
-      if (result) {
-        results.set(result.dogId, result.traits);
+  // Resolve API URL for server-side calls
+  const apiUrl = typeof window === 'undefined' 
+    ? (() => {
+        const base = process.env.NEXT_PUBLIC_SITE_URL || process.env.VERCEL_URL || 'http://localhost:3000';
+        const normalized = String(base).startsWith('http') ? String(base) : `https://${base}`;
+        return `${normalized}/api/infer-traits`;
+      })()
+    : '/api/infer-traits';
+  
+  const inferOne = async (dog: Dog) => {
+    try {
+      const description = dog.rawDescription || '';
+      const tags = dog.tags || [];
+      
+      const response = await fetch(apiUrl, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ description, tags }),
+      });
+      
+      if (!response.ok) {
+        console.warn(`Failed to infer traits for dog ${dog.id}: ${response.status}`);
+        return;
       }
-    });
-    
-    // Small delay between batches to avoid rate limits
-    if (i + batchSize < dogsWithDescriptions.length) {
-      await new Promise(resolve => setTimeout(resolve, 100));
+      
+      const traits: InferredTraits = await response.json();
+      results.set(dog.id, traits);
+    } catch (error) {
+      console.warn(`Error inferring traits for dog ${dog.id}:`, error);
     }
-  }
+  };
+  
+  // Bounded concurrency to avoid rate limits
+  let next = 0;
+  const worker = async () => {
+    while (next < dogsWithDescriptions.length) {
+      await inferOne(dogsWithDescriptions[next++]);
+    }
+  };
+  await Promise.all(
+    Array.from({ length: Math.min(batchSize, dogsWithDescriptions.length) }, worker)
+  );
   
   return results;
 }
@@ -1,5 +1,6 @@
 import OpenAI from 'openai';
 import { COPY_MAX } from './constants/copyLimits';
+import { TtlLruCache, jitteredTtl } from './cache/ttl-lru';
 
 // Note: Environment variable validation moved to getOpenAIClient() to avoid build-time errors
 
@@ -7,8 +8,9 @@ import { COPY_MAX } from './constants/copyLimits';
 let clientInstance: OpenAI | null = null;
 
 // Simple in-memory cache for responses (keyed by prompt hash)
-const responseCache = new Map<string, { response: NormalizedResponse; timestamp: number }>();
-const CACHE_TTL = 5 * 60 * 1000; // 5 minutes
+const CACHE_TTL = 5 * 60 * 1000; // 5 minutes, jittered ±15% per entry
+const CACHE_MAX_ENTRIES = 500;
+const responseCache = new TtlLruCache<NormalizedResponse>(CACHE_MAX_ENTRIES);
 
 /**
  * Get a memoized OpenAI client instance configured for the Responses API
@@ -99,8 +101,8 @@ export async function runResponse(options: ResponseOptions): Promise<NormalizedR
   
   // Check cache first
   const cached = responseCache.get(cacheKey);
-  if (cached && (Date.now() - cached.timestamp) < CACHE_TTL) {
-    return cached.response;
+  if (cached) {
+    return cached;
   }
   
   const client = getOpenAIClient();
@@ -129,7 +131,7 @@ export async function runResponse(options: ResponseOptions): Promise<NormalizedR
   };
   
   // Cache the result
-  responseCache.set(cacheKey, { response: result, timestamp: Date.now() });
+  responseCache.set(cacheKey, result, jitteredTtl(CACHE_TTL));
   
   return result;
 }
@@ -10,6 +10,13 @@ import { InferredTraits } from '@/app/api/infer-traits/route';
  * Deterministic scoring with weighted preferences based on origin (user > guidance > default)
  */
 
+// Breed fact lists, lowercased once at load so each dog is a Set lookup per breed
+const SHED_HIGH_BREEDS = new Set(['labrador retriever', 'golden retriever', 'german shepherd', 'husky', 'siberian husky']);
+const GROOMING_HIGH_BREEDS = new Set(['poodle', 'bichon frise', 'maltese', 'shih tzu', 'yorkshire terrier']);
+const ENERGY_HIGH_BREEDS = new Set(['border collie', 'australian shepherd', 'jack russell terrier', 'beagle']);
+const BARKY_BREEDS = new Set(['beagle', 'jack russell terrier', 'chihuahua', 'miniature pinscher']);
+const HYPOALLERGENIC_BREEDS = new Set(['poodle', 'bichon frise', 'maltese', 'shih tzu', 'yorkshire terrier', 'portuguese water dog']);
+
 /**
  * Derive features from dog data for scoring
  */
@@ -18,21 +25,11 @@ function deriveDogFeatures(dog: Dog) {
   
   // Basic breed facts for scoring
   const breedFacts = {
-    shedHigh: breeds.some(b => 
-      ['labrador retriever', 'golden retriever', 'german shepherd', 'husky', 'siberian husky'].includes(b)
-    ),
-    groomingHigh: breeds.some(b => 
-      ['poodle', 'bichon frise', 'maltese', 'shih tzu', 'yorkshire terrier'].includes(b)
-    ),
-    energyHigh: breeds.some(b => 
-      ['border collie', 'australian shepherd', 'jack russell terrier', 'beagle'].includes(b)
-    ),
-    barky: breeds.some(b => 
-      ['beagle', 'jack russell terrier', 'chihuahua', 'miniature pinscher'].includes(b)
-    ),
-    hypoallergenic: breeds.some(b => 
-      ['poodle', 'bichon frise', 'maltese', 'shih tzu', 'yorkshire terrier', 'portuguese water dog'].includes(b)
-    )
+    shedHigh: breeds.some(b => SHED_HIGH_BREEDS.has(b)),
+    groomingHigh: breeds.some(b => GROOMING_HIGH_BREEDS.has(b)),
+    energyHigh: breeds.some(b => ENERGY_HIGH_BREEDS.has(b)),
+    barky: breeds.some(b => BARKY_BREEDS.has(b)),
+    hypoallergenic: breeds.some(b => HYPOALLERGENIC_BREEDS.has(b))
   };
   
   // Age-based features
@@ -72,6 +69,24 @@ function getScoringWeight(origin: "user" | "guidance" | "default"): number {
   }
 }
 
+/**
+ * Lowercased age/size preference sets, built once per preferences object
+ * rather than once per scored dog
+ */
+const prefSetsCache = new WeakMap<EffectivePreferences, { ages: Set<string>; sizes: Set<string> }>();
+
+function getPrefSets(effectivePrefs: EffectivePreferences): { ages: Set<string>; sizes: Set<string> } {
+  let sets = prefSetsCache.get(effectivePrefs);
+  if (!sets) {
+    sets = {
+      ages: new Set(effectivePrefs.age.value.map(a => a.toLowerCase())),
+      sizes: new Set(effectivePrefs.size.value.map(s => s.toLowerCase())),
+    };
+    prefSetsCache.set(effectivePrefs, sets);
+  }
+  return sets;
+}
+
 /**
  * Score a dog against effective preferences
  * Uses OR-based logic: rewards overlap but never requires all facets to match
@@ -87,6 +102,7 @@ export function scoreDog(
   inferredTraits?: InferredTraits | null
 ): DogAnalysis {
   const features = deriveDogFeatures(dog);
+  const prefSets = getPrefSets(effectivePrefs);
   let score = 100; // Base score - all dogs start with positive score
   const matchedPrefs: string[] = [];
   const unmetPrefs: string[] = [];
@@ -98,9 +114,7 @@ export function scoreDog(
   // Age scoring (OR logic for multiple selections)
   if (effectivePrefs.age.value.length > 0) {
     totalPossibleMatches++;
-    const dogAgeLower = dog.age.toLowerCase();
-    const userAgesLower = effectivePrefs.age.value.map(a => a.toLowerCase());
-    const ageMatch = userAgesLower.includes(dogAgeLower);
+    const ageMatch = prefSets.ages.has(dog.age.toLowerCase());
     
     const weight = getScoringWeight(effectivePrefs.age.origin);
     
@@ -118,9 +132,7 @@ export function scoreDog(
   // Size scoring (OR logic for multiple selections)
   if (effectivePrefs.size.value.length > 0) {
     totalPossibleMatches++;
-    const dogSizeLower = features.sizeNormalized;
-    const userSizesLower = effectivePrefs.size.value.map(s => s.toLowerCase());
-    const sizeMatch = userSizesLower.includes(dogSizeLower);
+    const sizeMatch = prefSets.sizes.has(features.sizeNormalized);
     
     const weight = getScoringWeight(effectivePrefs.size.origin);
     
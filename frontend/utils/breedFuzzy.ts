@@ -373,37 +373,68 @@ export function expandUserBreedsV2(terms: string[]): BreedExpansion {
   return { expanded: uniqueExpanded, notes };
 }
 
+type BreedHitResult = { hit: boolean; tier?: number; reason?: string };
+type BreedMatcher = (dog: { breeds: string[]; tags?: string[]; rawDescription?: string }) => BreedHitResult;
+
+// Compiled matchers keyed by the expanded-term array. Callers pass the same
+// EffectivePreferences array for every dog in a request, so the terms are
+// normalized and indexed once instead of once per dog.
+const matcherCache = new WeakMap<string[], BreedMatcher>();
+
+/**
+ * Precompile the expanded breed terms into a per-dog matcher: normalized
+ * wanted terms as a Set for the exact/alias tiers, and family member Sets for
+ * the family tier.
+ */
+function compileBreedMatcher(expanded: string[]): BreedMatcher {
+  if (!expanded?.length) return () => ({ hit: true, tier: 99, reason: 'no-filter' });
+  const want = expanded.map(normalizeBaseV2);
+  const wantSet = new Set(want);
+  const familySets: Set<string>[] = [];
+  for (const w of want) {
+    const fam = BREED_FAMILIES_V2[w];
+    if (fam) familySets.push(new Set(fam));
+  }
+
+  return (dog) => {
+    const fields: string[] = [
+      ...(dog.breeds || []),
+      ...((dog.tags || []).filter(Boolean)),
+      ...(dog.rawDescription ? [dog.rawDescription] : [])
+    ].map(normalizeBaseV2);
+
+    // Tier 1: exact canonical
+    for (const f of fields) if (wantSet.has(f)) return { hit: true, tier: 1, reason: 'exact' };
+    // Tier 2: alias exact
+    for (const f of fields) {
+      const syn = SYNONYMS_V2[f];
+      if (syn && wantSet.has(syn)) return { hit: true, tier: 2, reason: 'alias' };
+    }
+    // Tier 3: family
+    for (const fam of familySets) {
+      if (fields.some(f => fam.has(f))) return { hit: true, tier: 3, reason: 'family' };
+    }
+    // Tier 4: phonetic/edit
+    for (const f of fields) for (const w of want) {
+      const ev = scoreCandidateV2(f, w);
+      if (ev.score >= 0.8) return { hit: true, tier: 4, reason: ev.reasons.join('|') };
+    }
+    // Tier 5: ngram
+    for (const f of fields) for (const w of want) if (cosineSimV2(f, w) >= 0.72) return { hit: true, tier: 5, reason: 'ngram' };
+    return { hit: false };
+  };
+}
+
 // Dog-aware hit producing tiers for scoring and ranking
 export function dogBreedHit(
   dog: { breeds: string[]; tags?: string[]; rawDescription?: string },
   expanded: string[]
-): { hit: boolean; tier?: number; reason?: string } {
+): BreedHitResult {
   if (!expanded?.length) return { hit: true, tier: 99, reason: 'no-filter' };
-  const fields: string[] = [
-    ...(dog.breeds || []),
-    ...((dog.tags || []).filter(Boolean)),
-    ...(dog.rawDescription ? [dog.rawDescription] : [])
-  ].map(normalizeBaseV2);
-  const want = expanded.map(normalizeBaseV2);
-
-  // Tier 1: exact canonical
-  for (const f of fields) for (const w of want) if (f === w) return { hit: true, tier: 1, reason: 'exact' };
-  // Tier 2: alias exact
-  for (const f of fields) {
-    const syn = SYNONYMS_V2[f];
-    if (syn && want.includes(syn)) return { hit: true, tier: 2, reason: 'alias' };
-  }
-  // Tier 3: family
-  for (const w of want) {
-    const fam = BREED_FAMILIES_V2[w];
-    if (fam && fields.some(f => fam.includes(f))) return { hit: true, tier: 3, reason: 'family' };
-  }
-  // Tier 4: phonetic/edit
-  for (const f of fields) for (const w of want) {
-    const ev = scoreCandidateV2(f, w);
-    if (ev.score >= 0.8) return { hit: true, tier: 4, reason: ev.reasons.join('|') };
+  let matcher = matcherCache.get(expanded);
+  if (!matcher) {
+    matcher = compileBreedMatcher(expanded);
+    matcherCache.set(expanded, matcher);
   }
-  // Tier 5: ngram
-  for (const f of fields) for (const w of want) if (cosineSimV2(f, w) >= 0.72) return { hit: true, tier: 5, reason: 'ngram' };
-  return { hit: false };
+  return matcher(dog);
 }
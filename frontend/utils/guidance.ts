@@ -15,43 +15,103 @@ export type GuidanceTokens = {
   };
 };
 
+// Each token is a single precompiled, case-insensitive alternation, so
+// tokenizing scans the guidance once per token instead of once per phrase
+// and never needs a lowercased copy of the input.
+function anyOf(...phrases: string[]): RegExp {
+  return new RegExp(phrases.map(p => p.replace(/[.*+?^${}()|[\]\\]/g, '\\$&')).join('|'), 'i');
+}
+
+const GUIDANCE_PATTERNS = {
+  age: {
+    puppy: anyOf("puppy", "baby"),
+    young: anyOf("young"),
+    adult: anyOf("adult"),
+    senior: anyOf("senior", "older"),
+  },
+  size: {
+    small: anyOf("small", "toy", "puppy"),
+    medium: anyOf("medium", "medium-sized"),
+    large: anyOf("large", "big"),
+    apartment: anyOf("apartment", "condo", "small space"),
+  },
+  energy: {
+    low: anyOf("low energy", "calm", "laid back", "chill"),
+    medium: anyOf("moderate energy", "medium energy", "balanced"),
+    high: anyOf("high energy", "energetic", "active dog"),
+    active: anyOf("active", "hike", "runner", "exercise", "jog"),
+    lowMaint: anyOf("low-maintenance", "low maintenance", "easy care"),
+  },
+  temperament: {
+    hypoallergenic: anyOf("hypoallergenic", "allergy", "allergies", "non-shedding"),
+    quiet: anyOf("quiet", "not barky", "calm", "not vocal", "doesn't bark"),
+    goodWithKids: anyOf("good with kids", "kid", "family", "children", "child-friendly"),
+    catFriendly: anyOf("cat", "cats", "feline", "good with cats"),
+  },
+  flags: {
+    lowMaintenance: anyOf("low-maintenance", "low maintenance", "first-time", "retired", "easy care", "minimal grooming"),
+    firstTimeOwner: anyOf("first-time", "first time", "beginner", "new to dogs", "never had a dog"),
+    apartmentOk: anyOf("apartment", "condo", "small space", "urban", "city"),
+    quietPreferred: anyOf("quiet", "not barky", "calm", "not vocal", "doesn't bark", "silent"),
+    kidFriendly: anyOf("good with kids", "kid", "family", "children", "child-friendly", "family dog"),
+    catFriendly: anyOf("cat", "cats", "feline", "good with cats", "cat compatible"),
+  },
+};
+
+// Shared result for the common no-guidance case. Frozen (nested objects too)
+// so a caller that mutates it throws instead of corrupting later calls.
+const EMPTY_GUIDANCE_TOKENS: GuidanceTokens = Object.freeze({
+  age: Object.freeze({ puppy: false, young: false, adult: false, senior: false }),
+  size: Object.freeze({ small: false, medium: false, large: false, apartment: false }),
+  energy: Object.freeze({ low: false, medium: false, high: false, active: false, lowMaint: false }),
+  temperament: Object.freeze({ hypoallergenic: false, quiet: false, goodWithKids: false, catFriendly: false }),
+  flags: Object.freeze({
+    lowMaintenance: false,
+    firstTimeOwner: false,
+    apartmentOk: false,
+    quietPreferred: false,
+    kidFriendly: false,
+    catFriendly: false,
+  }),
+});
+
 export function tokenizeGuidance(g?: string): GuidanceTokens {
-  const s = (g || "").toLowerCase();
-  const has = (...xs: string[]) => xs.some(x => s.includes(x));
+  if (!g || !g.trim()) return EMPTY_GUIDANCE_TOKENS;
+  const has = (re: RegExp) => re.test(g);
   
   return {
     age: {
-      puppy: has("puppy", "baby"),
-      young: has("young"),
-      adult: has("adult"),
-      senior: has("senior", "older"),
+      puppy: has(GUIDANCE_PATTERNS.age.puppy),
+      young: has(GUIDANCE_PATTERNS.age.young),
+      adult: has(GUIDANCE_PATTERNS.age.adult),
+      senior: has(GUIDANCE_PATTERNS.age.senior),
     },
     size: {
-      small: has("small", "toy", "puppy"),
-      medium: has("medium", "medium-sized"),
-      large: has("large", "big"),
-      apartment: has("apartment", "condo", "small space"),
+      small: has(GUIDANCE_PATTERNS.size.small),
+      medium: has(GUIDANCE_PATTERNS.size.medium),
+      large: has(GUIDANCE_PATTERNS.size.large),
+      apartment: has(GUIDANCE_PATTERNS.size.apartment),
     },
     energy: {
-      low: has("low energy", "calm", "laid back", "chill"),
-      medium: has("moderate energy", "medium energy", "balanced"),
-      high: has("high energy", "energetic", "active dog"),
-      active: has("active", "hike", "runner", "exercise", "jog"),
-      lowMaint: has("low-maintenance", "low maintenance", "easy care"),
+      low: has(GUIDANCE_PATTERNS.energy.low),
+      medium: has(GUIDANCE_PATTERNS.energy.medium),
+      high: has(GUIDANCE_PATTERNS.energy.high),
+      active: has(GUIDANCE_PATTERNS.energy.active),
+      lowMaint: has(GUIDANCE_PATTERNS.energy.lowMaint),
     },
     temperament: {
-      hypoallergenic: has("hypoallergenic", "allergy", "allergies", "non-shedding"),
-      quiet: has("quiet", "not barky", "calm", "not vocal", "doesn't bark"),
-      goodWithKids: has("good with kids", "kid", "family", "children", "child-friendly"),
-      catFriendly: has("cat", "cats", "feline", "good with cats"),
+      hypoallergenic: has(GUIDANCE_PATTERNS.temperament.hypoallergenic),
+      quiet: has(GUIDANCE_PATTERNS.temperament.quiet),
+      goodWithKids: has(GUIDANCE_PATTERNS.temperament.goodWithKids),
+      catFriendly: has(GUIDANCE_PATTERNS.temperament.catFriendly),
     },
     flags: {
-      lowMaintenance: has("low-maintenance", "low maintenance", "first-time", "retired", "easy care", "minimal grooming"),
-      firstTimeOwner: has("first-time", "first time", "beginner", "new to dogs", "never had a dog"),
-      apartmentOk: has("apartment", "condo", "small space", "urban", "city"),
-      quietPreferred: has("quiet", "not barky", "calm", "not vocal", "doesn't bark", "silent"),
-      kidFriendly: has("good with kids", "kid", "family", "children", "child-friendly", "family dog"),
-      catFriendly: has("cat", "cats", "feline", "good with cats", "cat compatible"),
+      lowMaintenance: has(GUIDANCE_PATTERNS.flags.lowMaintenance),
+      firstTimeOwner: has(GUIDANCE_PATTERNS.flags.firstTimeOwner),
+      apartmentOk: has(GUIDANCE_PATTERNS.flags.apartmentOk),
+      quietPreferred: has(GUIDANCE_PATTERNS.flags.quietPreferred),
+      kidFriendly: has(GUIDANCE_PATTERNS.flags.kidFriendly),
+      catFriendly: has(GUIDANCE_PATTERNS.flags.catFriendly),
     },
   };
 }